@@ -1,11 +1,81 @@
+import io
 import os
+import shutil
+import subprocess
 import tempfile
+import threading
 from pathlib import Path
 from typing import Optional
 import openai
 from pydub import AudioSegment
 from config import Config
 
+# Audio piped out of ffmpeg for streamed input: 16 kHz mono, as Whisper
+# resamples to that anyway. MP3 rather than raw PCM, as the transcription
+# API needs a container format, and it keeps the upload small
+STREAM_AUDIO_ARGS = ["-vn", "-ac", "1", "-ar", "16000", "-f", "mp3"]
+
+# Bytes copied into ffmpeg per read
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class StreamDecodeError(Exception):
+    """Raised when ffmpeg can't decode a piped video stream."""
+
+
+def pipe_through_ffmpeg(fileobj, output_args) -> bytes:
+    """
+    Pipe a readable video stream through ffmpeg and return what it outputs.
+    
+    Args:
+        fileobj: Readable stream of the video
+        output_args: ffmpeg output options, e.g. STREAM_AUDIO_ARGS
+    
+    Returns:
+        The bytes ffmpeg wrote to stdout
+    
+    Raises:
+        StreamDecodeError: If ffmpeg failed or produced no output
+    """
+    # ffmpeg's errors go to a file rather than a third pipe: a corrupt
+    # stream can log more than a pipe buffer holds, and ffmpeg would then
+    # block writing them while stdout is being read
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            ["ffmpeg", "-nostdin", "-loglevel", "error", "-i", "pipe:0", *output_args, "pipe:1"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file
+        )
+        
+        def feed_ffmpeg():
+            try:
+                shutil.copyfileobj(fileobj, process.stdin, STREAM_CHUNK_SIZE)
+            except (BrokenPipeError, OSError):
+                # ffmpeg exited early; its return code reports the failure
+                pass
+            finally:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+        
+        # Feed ffmpeg from another thread so reading its output can't deadlock
+        feeder = threading.Thread(target=feed_ffmpeg, daemon=True)
+        feeder.start()
+        
+        with process.stdout:
+            output = process.stdout.read()
+        process.wait()
+        feeder.join()
+        
+        if process.returncode != 0 or not output:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace").strip()
+            raise StreamDecodeError(f"ffmpeg could not decode the stream: {stderr or 'no output'}")
+    return output
+
+
 class AudioProcessor:
     def __init__(self):
         self.client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
@@ -24,6 +94,14 @@ class AudioProcessor:
         except Exception as e:
             raise Exception(f"Failed to extract audio from video: {str(e)}")
     
+    def extract_audio_from_stream(self, fileobj) -> bytes:
+        """Extract audio from a readable video stream by piping it through ffmpeg.
+        
+        Raises:
+            StreamDecodeError: If ffmpeg can't decode the stream
+        """
+        return pipe_through_ffmpeg(fileobj, STREAM_AUDIO_ARGS)
+    
     def transcribe_audio(self, audio_path: str) -> str:
         """Transcribe audio to text using OpenAI Whisper."""
         try:
@@ -37,6 +115,30 @@ class AudioProcessor:
         except Exception as e:
             raise Exception(f"Failed to transcribe audio: {str(e)}")
     
+    def process_stream(self, fileobj) -> str:
+        """
+        Process a readable video stream and return transcribed text.
+        
+        The stream is decoded as it is read and the audio kept in memory, so
+        nothing is written to disk. An mp4 whose index is at the end of the
+        file can't be decoded from a stream; process_input handles those.
+        """
+        audio = self.extract_audio_from_stream(fileobj)
+        
+        audio_size_mb = len(audio) / (1024 * 1024)
+        if audio_size_mb > Config.MAX_FILE_SIZE_MB:
+            raise ValueError(f"Audio size ({audio_size_mb:.1f}MB) exceeds maximum allowed size ({Config.MAX_FILE_SIZE_MB}MB)")
+        
+        try:
+            transcript = self.client.audio.transcriptions.create(
+                model="whisper-1",
+                file=("audio.mp3", io.BytesIO(audio)),
+                response_format="text"
+            )
+            return transcript
+        except Exception as e:
+            raise Exception(f"Failed to transcribe audio: {str(e)}")
+    
     def process_input(self, file_path: str) -> str:
         """Process audio or video input and return transcribed text."""
         file_path = Path(file_path)
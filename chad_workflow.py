@@ -512,15 +512,20 @@ class ChadWorkflow:
             logger.error(f"Quick roast failed: {str(e)}")
             raise
     
-    def test_all_services(self) -> Dict[str, bool]:
-        """Test all service connections."""
+    def test_all_services(self, deep: bool = True) -> Dict[str, bool]:
+        """
+        Test all service connections.
+        
+        Args:
+            deep: Send a live request to OpenAI rather than only validating the API key
+        """
         results = {}
         
         logger.info("Testing service connections...")
         
         # Test OpenAI
         try:
-            results["openai"] = self.hot_take_generator.test_connection()
+            results["openai"] = self.hot_take_generator.test_connection(deep=deep)
             logger.info(f"OpenAI connection: {'✓' if results['openai'] else '✗'}")
         except Exception as e:
             results["openai"] = False
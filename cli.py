@@ -10,6 +10,7 @@ import json
 from pathlib import Path
 from chad_workflow import ChadWorkflow
 from persona_manager import persona_manager
+from logging_setup import start_log_listener
 
 def main():
     parser = argparse.ArgumentParser(
@@ -137,6 +138,7 @@ def main():
     if args.verbose:
         import logging
         logging.getLogger().setLevel(logging.DEBUG)
+    start_log_listener()
     
     try:
         # Handle persona-related commands first
@@ -25,6 +25,21 @@ class Config:
     TEMP_DIR = Path(os.getenv("TEMP_DIR", "./temp"))
     OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", "./output"))
     
+    # OpenAI Request Settings
+    OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "12"))
+    OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+    OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", "500"))  # 0 disables
+    OPENAI_TPM_LIMIT = int(os.getenv("OPENAI_TPM_LIMIT", "500000"))  # 0 disables
+    # Server worker processes. Each has its own rate limiter, so the limits
+    # above (which are for the whole API key) are split evenly between them
+    WORKERS = int(os.getenv("WORKERS", "1"))
+    
+    # Response Cache Settings
+    DISABLE_CACHE = os.getenv("DISABLE_CACHE", "false").lower() in ("1", "true", "yes")
+    # Shared across worker processes and restarts when set; memory-only otherwise
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", os.getenv("REDIS_URL"))
+    CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "86400"))
+    
     # S3 Settings
     S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "digital-twin-storage")
     AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
@@ -5,8 +5,23 @@ This file demonstrates how to create and configure new personas
 for the Digital Twin system.
 """
 
+import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
 from persona_manager import persona_manager, Persona
 
+# Prompt bodies for the example personas, keyed by persona ID
+PROMPT_TEMPLATES_FILE = "personas/prompt_templates.json"
+
+
+@functools.lru_cache(maxsize=1)
+def load_prompt_templates() -> Dict[str, str]:
+    """Load the example persona prompts (read once, on first use)."""
+    with open(PROMPT_TEMPLATES_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 
 def add_example_personas():
     """Add example personas to demonstrate the system."""
@@ -47,10 +62,11 @@ def add_example_personas():
         description="Comedian who finds humor in the quirks of startup culture"
     )
     
-    # Add personas to the manager
-    persona_manager.add_persona("sarah_chen", tech_critic)
-    persona_manager.add_persona("marcus_rodriguez", investor)
-    persona_manager.add_persona("jake_thompson", comedian)
+    # Add personas to the manager, saving once at the end
+    with persona_manager.batch():
+        persona_manager.add_persona("sarah_chen", tech_critic)
+        persona_manager.add_persona("marcus_rodriguez", investor)
+        persona_manager.add_persona("jake_thompson", comedian)
     
     print("✅ Added example personas:")
     print("  - sarah_chen: Tech Critic")
@@ -58,118 +74,29 @@ def add_example_personas():
     print("  - jake_thompson: Comedian")
 
 
-def create_prompt_templates():
-    """Create example prompt files for the personas."""
-    
-    # Sarah Chen - Tech Critic Prompt
-    sarah_prompt = """You are Sarah Chen, a respected tech journalist and startup critic with over a decade of experience covering the tech industry. You have a sharp eye for spotting red flags, overhyped claims, and genuine innovation.
-
-Your style is:
-- Analytical and data-driven
-- Slightly skeptical but fair
-- Focused on market reality vs. founder dreams
-- Known for asking the tough questions others avoid
-- Witty but professional
-
-When reviewing pitches, focus on:
-1. Market validation and customer research
-2. Competitive landscape analysis
-3. Technical feasibility
-4. Team capabilities and experience
-5. Financial projections and unit economics
-
-Be constructive but honest. Call out BS when you see it, but also highlight genuine potential. Your readers trust your judgment, so be thorough but accessible.
-
-Format your response as a tech review:
-- Executive Summary
-- What Works
-- Red Flags
-- Market Analysis
-- Verdict
-
-Stay in character and maintain your journalistic integrity."""
-    
-    # Marcus Rodriguez - Investor Prompt
-    marcus_prompt = """You are Marcus Rodriguez, a successful angel investor who's backed over 50 startups, with 3 unicorns and 2 spectacular failures under your belt. You've seen every pitch imaginable and have a sixth sense for what works.
-
-Your investment philosophy:
-- Team first, idea second
-- Market timing is everything
-- Unit economics must make sense
-- Traction beats everything
-- Trust your gut, but verify with data
+def _write_prompt_file(path_and_body: Tuple[str, str]) -> None:
+    """Write a single prompt file."""
+    path, body = path_and_body
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(body)
 
-You're known for:
-- Asking the uncomfortable questions
-- Focusing on execution over vision
-- Being brutally honest about market realities
-- Having a soft spot for underdog founders
-- Sharing war stories from your own startup days
 
-When evaluating pitches, look for:
-1. Founder-market fit
-2. Clear path to revenue
-3. Realistic market size
-4. Competitive moats
-5. Execution capability
-
-Be direct but encouraging. You want founders to succeed, but you won't sugarcoat the challenges ahead.
-
-Format your response as an investor review:
-- First Impression
-- Team Assessment
-- Market Opportunity
-- Competitive Analysis
-- Investment Decision
-
-Stay in character as the experienced investor who's been there, done that."""
+def create_prompt_templates():
+    """Create example prompt files for the personas."""
     
-    # Jake Thompson - Comedian Prompt
-    jake_prompt = """You are Jake Thompson, a stand-up comedian who's made a career out of roasting tech culture, startup absurdity, and the Silicon Valley bubble. You find humor in everything from pitch deck buzzwords to founder delusions of grandeur.
-
-Your comedic style:
-- Observational humor about tech culture
-- Playful roasting without being mean
-- Pop culture references and analogies
-- Self-deprecating humor about your own tech failures
-- Witty one-liners and callbacks
-
-You love to poke fun at:
-- Overused startup buzzwords
-- Unrealistic valuations
-- Founder ego and delusions
-- Tech bro culture
-- Absurd pitch claims
-
-But you also appreciate:
-- Genuine innovation
-- Humble founders
-- Realistic business models
-- Honest market analysis
-
-Your goal is to entertain while providing actual insights. Make people laugh, but also make them think.
-
-Format your response as a comedy routine:
-- Opening Hook
-- Setup and Observations
-- The Roast (with humor)
-- Unexpected Insight
-- Closing Punchline
-
-Stay in character as the comedian who sees through the BS but still loves the game."""
+    templates = load_prompt_templates()
     
     # Create the prompt files
     import os
     os.makedirs("personas/prompts", exist_ok=True)
     
-    with open("personas/prompts/sarah_chen.txt", "w") as f:
-        f.write(sarah_prompt)
-    
-    with open("personas/prompts/marcus_rodriguez.txt", "w") as f:
-        f.write(marcus_prompt)
-    
-    with open("personas/prompts/jake_thompson.txt", "w") as f:
-        f.write(jake_prompt)
+    prompt_files = [
+        (f"personas/prompts/{persona_id}.txt", body)
+        for persona_id, body in templates.items()
+    ]
+    with ThreadPoolExecutor(max_workers=len(prompt_files) or 1) as executor:
+        # list() surfaces any write error
+        list(executor.map(_write_prompt_file, prompt_files))
     
     print("✅ Created example prompt files in personas/prompts/")
 
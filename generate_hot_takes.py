@@ -4,7 +4,7 @@ Script to generate hot_take transcripts for jobs missing them.
 
 This script:
 1. Finds all jobs in Firestore that are missing results.hot_take
-2. Downloads the video from the video_url
+2. Streams the video from the video_url through ffmpeg (downloading it if needed)
 3. Runs Whisper to generate a transcript
 4. Updates the job with the transcript in results.hot_take
 """
@@ -13,17 +13,17 @@ import os
 import sys
 import logging
 import tempfile
-import requests
-from typing import Dict, List, Optional
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+import threading
+import shutil
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from job_storage import create_job_storage
+from video_probe import PEEK_SIZE, PeekedStream, index_at_end
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +32,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Whisper model shared across jobs (loaded lazily on first use)
+_WHISPER_MODEL = None
+
+# Whisper expects 16 kHz mono audio
+WHISPER_SAMPLE_RATE = 16000
+
+# ffmpeg output options for raw 16-bit PCM at Whisper's sample rate
+PCM_AUDIO_ARGS = ["-vn", "-f", "s16le", "-ac", "1", "-ar", str(WHISPER_SAMPLE_RATE)]
+
+# Videos fetched ahead of the transcriber, and concurrent Firestore updates
+DOWNLOAD_WORKERS = int(os.getenv("HOT_TAKE_DOWNLOAD_WORKERS", "4"))
+UPDATE_WORKERS = int(os.getenv("HOT_TAKE_UPDATE_WORKERS", "4"))
+
+# Sequence numbers for downloaded video filenames
+_download_ids = itertools.count()
+
+# HTTP session shared by all downloads so connections are reused across jobs
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def get_http_session():
+    """
+    Get the shared requests session, creating it on first use.
+    
+    The session keeps a connection pool sized for the download workers and
+    retries transient connection failures with backoff.
+    
+    Returns:
+        requests.Session instance
+    """
+    global _HTTP_SESSION
+    with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=max(16, DOWNLOAD_WORKERS),
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+def get_whisper_model():
+    """
+    Load the Whisper model once and reuse it for every job.
+    
+    The model name can be overridden with the WHISPER_MODEL environment
+    variable (defaults to "base" for speed).
+    
+    Returns:
+        Loaded Whisper model
+    """
+    global _WHISPER_MODEL
+    if _WHISPER_MODEL is None:
+        # Import whisper here to avoid dependency issues
+        import whisper
+        import torch
+        
+        model_name = os.getenv("WHISPER_MODEL", "base")
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        logger.info(f"Loading Whisper model '{model_name}' on {device}")
+        _WHISPER_MODEL = whisper.load_model(model_name, device=device)
+    return _WHISPER_MODEL
+
 
 def download_video(video_url: str, temp_dir: str) -> Optional[str]:
     """
@@ -39,7 +111,7 @@ def download_video(video_url: str, temp_dir: str) -> Optional[str]:
     
     Args:
         video_url: URL of the video to download
-        temp_dir: Directory to save the video
+        temp_dir: Directory to save the video (must be private to this process)
     
     Returns:
         Path to downloaded video file, or None if failed
@@ -47,53 +119,137 @@ def download_video(video_url: str, temp_dir: str) -> Optional[str]:
     try:
         logger.info(f"Downloading video from: {video_url}")
         
-        # Create a temporary file with .mp4 extension
-        temp_file = tempfile.NamedTemporaryFile(
-            suffix='.mp4', 
-            delete=False, 
-            dir=temp_dir
-        )
-        temp_path = temp_file.name
-        temp_file.close()
-        
         # Download the video
-        response = requests.get(video_url, stream=True)
+        response = get_http_session().get(video_url, stream=True)
         response.raise_for_status()
-        
-        with open(temp_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
-        file_size = os.path.getsize(temp_path)
-        logger.info(f"Downloaded video: {temp_path} ({file_size} bytes)")
-        return temp_path
+        response.raw.decode_content = True
+        with response:
+            return save_stream(response.raw, temp_dir)
         
     except Exception as e:
         logger.error(f"Failed to download video from {video_url}: {e}")
         return None
 
 
-def transcribe_video(video_path: str) -> Optional[str]:
+def save_stream(stream, temp_dir: str) -> str:
+    """
+    Write a video stream to a temporary file.
+    
+    Args:
+        stream: Readable stream of the video
+        temp_dir: Directory to save the video (must be private to this process)
+    
+    Returns:
+        Path to the saved video file
+    """
+    # temp_dir is private to this run, so a counter gives unique names
+    # without the mkstemp/NamedTemporaryFile round trip
+    temp_path = os.path.join(temp_dir, f"{next(_download_ids)}.mp4")
+    
+    # Copy in 1 MB blocks so the loop runs in C rather than per chunk
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb', buffering=0) as f:
+        shutil.copyfileobj(stream, f, 1024 * 1024)
+    
+    file_size = os.path.getsize(temp_path)
+    logger.info(f"Downloaded video: {temp_path} ({file_size} bytes)")
+    return temp_path
+
+
+def stream_audio(stream, video_url: str) -> Optional[Any]:
+    """
+    Pipe a video stream through ffmpeg and decode its audio track in one pass.
+    
+    The body is piped straight into ffmpeg, which emits 16 kHz mono PCM, so
+    nothing is written to disk and decoding overlaps the download.
+    
+    Args:
+        stream: Readable stream of the video
+        video_url: URL of the video, for log messages
+    
+    Returns:
+        Float32 numpy array of audio samples, or None if ffmpeg couldn't decode the stream
+    """
+    import numpy as np
+    from audio_processor import StreamDecodeError, pipe_through_ffmpeg
+    
+    logger.info(f"Streaming audio from: {video_url}")
+    try:
+        pcm = pipe_through_ffmpeg(stream, PCM_AUDIO_ARGS)
+    except StreamDecodeError as e:
+        logger.warning(f"Failed to stream audio from {video_url}: {e}")
+        return None
+    
+    audio = np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+    logger.info(f"Decoded {len(audio) / WHISPER_SAMPLE_RATE:.1f}s of audio")
+    return audio
+
+
+def fetch_job_audio(video_url: str, temp_dir: str) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    Fetch a job's audio, streaming when possible and downloading otherwise.
+    
+    The start of the video is peeked at first: an mp4 whose index is at the
+    end of the file can't be decoded from a pipe, so the rest of the same
+    transfer is saved to a file instead. Only if ffmpeg can't decode a stream
+    for some other reason, or the transfer breaks off, is the video
+    downloaded again.
+    
+    Args:
+        video_url: URL of the video
+        temp_dir: Directory to save the video if it has to be downloaded
+    
+    Returns:
+        Tuple of (audio for Whisper, downloaded file path to clean up).
+        Audio is None if the server refused the video or both strategies failed.
+    """
+    import requests
+    
+    try:
+        with get_http_session().get(video_url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            head = response.raw.read(PEEK_SIZE)
+            if index_at_end(head):
+                logger.info(f"Video index is at the end of the file, downloading: {video_url}")
+                video_path = save_stream(PeekedStream(head, response.raw), temp_dir)
+                return video_path, video_path
+            audio = stream_audio(PeekedStream(head, response.raw), video_url)
+        if audio is not None:
+            return audio, None
+    except requests.HTTPError as e:
+        # Downloading the same URL again would get the same answer
+        logger.error(f"Failed to fetch video from {video_url}: {e}")
+        return None, None
+    except Exception as e:
+        logger.warning(f"Failed to stream video from {video_url}: {e}")
+    
+    video_path = download_video(video_url, temp_dir)
+    return video_path, video_path
+
+
+def transcribe_video(audio) -> Optional[str]:
     """
     Transcribe video using Whisper.
     
     Args:
-        video_path: Path to the video file
+        audio: Path to the video file, or a 16 kHz float32 audio array
     
     Returns:
         Transcript text, or None if failed
     """
+    source = audio if isinstance(audio, str) else "streamed audio"
     try:
-        logger.info(f"Transcribing video: {video_path}")
-        
-        # Import whisper here to avoid dependency issues
-        import whisper
+        logger.info(f"Transcribing video: {source}")
         
-        # Load the model (use base model for speed, can be changed to larger models)
-        model = whisper.load_model("base")
+        model = get_whisper_model()
         
-        # Transcribe the video
-        result = model.transcribe(video_path)
+        # Transcribe the video (English only, so skip language detection)
+        result = model.transcribe(
+            audio,
+            language="en",
+            fp16=model.device.type == "cuda"
+        )
         
         transcript = result["text"].strip()
         logger.info(f"Generated transcript ({len(transcript)} characters)")
@@ -104,42 +260,31 @@ def transcribe_video(video_path: str) -> Optional[str]:
         logger.error("Whisper not installed. Install with: pip install openai-whisper")
         return None
     except Exception as e:
-        logger.error(f"Failed to transcribe video {video_path}: {e}")
+        logger.error(f"Failed to transcribe video {source}: {e}")
         return None
 
 
-def find_jobs_missing_hot_take(job_storage) -> List[Dict]:
+def find_jobs_missing_hot_take(job_storage) -> List[Tuple[Optional[str], Optional[str]]]:
     """
     Find all jobs that are missing results.hot_take.
     
+    The query is read to the end before any job is processed: transcribing
+    every job can take hours, far longer than Firestore keeps a query stream
+    open. Only each job's ID and video URL are kept, so this stays small.
+    
     Args:
         job_storage: Firestore job storage instance
     
     Returns:
-        List of job data dictionaries
+        List of (job ID, video URL) tuples
     """
-    try:
-        logger.info("Finding jobs missing hot_take...")
-        
-        # Get all jobs from Firestore
-        all_jobs = job_storage.list_jobs(limit=1000)
-        
-        missing_hot_take = []
-        for job in all_jobs:
-            # Check if job has results and video_url but no hot_take
-            results = job.get("results", {})
-            video_url = results.get("video_url")
-            hot_take = results.get("hot_take")
-            
-            if video_url and not hot_take:
-                missing_hot_take.append(job)
-        
-        logger.info(f"Found {len(missing_hot_take)} jobs missing hot_take")
-        return missing_hot_take
-        
-    except Exception as e:
-        logger.error(f"Failed to find jobs missing hot_take: {e}")
-        return []
+    logger.info("Finding jobs missing hot_take...")
+    jobs = [
+        (job.get("id"), job.get("results", {}).get("video_url"))
+        for job in job_storage.iter_jobs_missing_field("results.video_url", "results.hot_take")
+    ]
+    logger.info(f"Found {len(jobs)} jobs missing hot_take")
+    return jobs
 
 
 def update_job_with_hot_take(job_storage, job_id: str, hot_take: str) -> bool:
@@ -155,27 +300,15 @@ def update_job_with_hot_take(job_storage, job_id: str, hot_take: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        # Get current job data
-        job_data = job_storage.get_job(job_id)
-        if not job_data:
-            logger.error(f"Job {job_id} not found")
-            return False
-        
-        # Update the results.hot_take field
-        if "results" not in job_data:
-            job_data["results"] = {}
-        
-        job_data["results"]["hot_take"] = hot_take
-        
-        # Update the job
-        success = job_storage.update_job(job_id, {
-            "results": job_data["results"]
+        # Update only the results.hot_take field, leaving the rest of results untouched
+        success = job_storage.update_job_fields(job_id, {
+            "results.hot_take": hot_take
         })
         
         if success:
             logger.info(f"Updated job {job_id} with hot_take")
         else:
-            logger.error(f"Failed to update job {job_id}")
+            logger.error(f"Failed to update job {job_id} (not found)")
         
         return success
         
@@ -186,6 +319,7 @@ def update_job_with_hot_take(job_storage, job_id: str, hot_take: str) -> bool:
 
 def main():
     """Main function to process jobs missing hot_take."""
+    from job_storage import create_job_storage
     
     # Check if Firestore credentials are configured
     project_id = os.getenv("FIRESTORE_PROJECT_ID")
@@ -201,66 +335,103 @@ def main():
         # Find jobs missing hot_take
         jobs_missing_hot_take = find_jobs_missing_hot_take(job_storage)
         
-        if not jobs_missing_hot_take:
-            logger.info("No jobs found missing hot_take")
+        # Load Whisper up front so the first job doesn't pay the model load
+        try:
+            get_whisper_model()
+        except ImportError:
+            logger.error("Whisper not installed. Install with: pip install openai-whisper")
             return
         
         # Create temporary directory for video downloads
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as download_pool, \
+                ThreadPoolExecutor(max_workers=UPDATE_WORKERS) as update_pool:
             logger.info(f"Using temporary directory: {temp_dir}")
             
+            total_count = 0
             processed_count = 0
             failed_count = 0
             
-            for job in jobs_missing_hot_take:
-                job_id = job.get("id")
-                video_url = job.get("results", {}).get("video_url")
-                
-                if not job_id or not video_url:
-                    logger.warning(f"Job {job_id} missing required fields")
-                    failed_count += 1
-                    continue
+            def jobs_to_fetch():
+                nonlocal total_count, failed_count
+                for job_id, video_url in jobs_missing_hot_take:
+                    total_count += 1
+                    
+                    if not job_id or not video_url:
+                        logger.warning(f"Job {job_id} missing required fields")
+                        failed_count += 1
+                        continue
+                    
+                    yield job_id, video_url
+            
+            # Keep a bounded window of downloads in flight so the network stays
+            # busy while Whisper transcribes, without buffering every video
+            jobs_iter = jobs_to_fetch()
+            pending = deque()
+            
+            def prefetch_next():
+                next_job = next(jobs_iter, None)
+                if next_job:
+                    job_id, video_url = next_job
+                    pending.append((job_id, download_pool.submit(fetch_job_audio, video_url, temp_dir)))
+            
+            for _ in range(DOWNLOAD_WORKERS):
+                prefetch_next()
+            
+            update_futures = []
+            while pending:
+                job_id, audio_future = pending.popleft()
+                prefetch_next()
                 
                 logger.info(f"Processing job {job_id}")
                 
+                video_path = None
                 try:
-                    # Download the video
-                    video_path = download_video(video_url, temp_dir)
-                    if not video_path:
+                    audio, video_path = audio_future.result()
+                    if audio is None:
                         logger.error(f"Failed to download video for job {job_id}")
                         failed_count += 1
                         continue
                     
                     # Generate transcript
-                    transcript = transcribe_video(video_path)
+                    transcript = transcribe_video(audio)
                     if not transcript:
                         logger.error(f"Failed to transcribe video for job {job_id}")
                         failed_count += 1
                         continue
                     
-                    # Update job with hot_take
-                    success = update_job_with_hot_take(job_storage, job_id, transcript)
-                    if success:
-                        processed_count += 1
-                    else:
-                        failed_count += 1
-                    
-                    # Clean up downloaded video
-                    try:
-                        os.unlink(video_path)
-                    except:
-                        pass
+                    # Update job with hot_take in the background
+                    update_futures.append(
+                        update_pool.submit(update_job_with_hot_take, job_storage, job_id, transcript)
+                    )
                     
                 except Exception as e:
                     logger.error(f"Failed to process job {job_id}: {e}")
                     failed_count += 1
                     continue
+                finally:
+                    # Clean up downloaded video
+                    if video_path:
+                        try:
+                            os.unlink(video_path)
+                        except OSError:
+                            pass
+            
+            for update_future in update_futures:
+                if update_future.result():
+                    processed_count += 1
+                else:
+                    failed_count += 1
+        
+        if not total_count:
+            logger.info("No jobs found missing hot_take")
+            return
         
         # Summary
         logger.info("=" * 50)
         logger.info("HOT_TAKE GENERATION SUMMARY")
         logger.info("=" * 50)
-        logger.info(f"Total jobs missing hot_take: {len(jobs_missing_hot_take)}")
+        logger.info(f"Total jobs missing hot_take: {total_count}")
         logger.info(f"Successfully processed: {processed_count}")
         logger.info(f"Failed to process: {failed_count}")
         logger.info("Hot take generation completed!")
@@ -271,4 +442,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+
     main()
@@ -1,12 +1,451 @@
-import openai
+import os
+import re
 import time
-from typing import Optional, Dict, Any
+import logging
+import asyncio
+import json
+import hashlib
+import threading
+import functools
+import concurrent.futures
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Union, AsyncIterator
 from config import Config
 from persona_manager import persona_manager
 
+logger = logging.getLogger(__name__)
+
+CHAD_PROMPT_FILE = "personas/prompts/chad_goldstein.txt"
+
+# How long idle connections to the API are kept open (seconds)
+KEEPALIVE_SECONDS = 300
+
+# Output tokens assumed for rate limiting when a request sets no max_completion_tokens
+ESTIMATED_OUTPUT_TOKENS = 800
+
+# Hidden reasoning tokens count toward max_completion_tokens on gpt-5, so an
+# output cap is raised by this allowance for the request's reasoning effort
+# (None is the API default, medium)
+REASONING_TOKEN_ALLOWANCE = {
+    "minimal": 64,
+    "low": 1024,
+    "medium": 4096,
+    "high": 16384,
+    None: 4096
+}
+
+# End of a sentence in streamed output (punctuation followed by whitespace)
+SENTENCE_END = re.compile(r"[.!?]\s")
+
+# Speech formatting instructions included with every request
+SPEECH_RULES = """Be sure to generate only the spoken words. Generate sentences that sound natural when spoken.
+Incorporate Punctuation Marks:
+* Commas (,): Create shorter breaks.
+* Periods (.): Introduce longer breaks with downward inflection.
+
+Write out numbers and avoid abbreviations for clarity. For example:
+* "2012" becomes "twenty twelve."
+* "3/8" becomes "three eighths of an inch."
+* "01:18" becomes "one minute and eighteen seconds."
+* "10-19-2016" becomes "October nineteenth, two thousand sixteen."
+* "150th CT NE, Redmond, WA" becomes "150th Court Northeast, Redmond, Washington."
+
+Replace acronyms with their sounded-out versions, like "AI" (as "a-eye") or "AWS" (as "a-double you-s")."""
+
+# Audio tag menu included when audio tags are requested
+AUDIO_TAGS = """Add audio tags in square brackets to make it sound more realistic and for dramatic effect. Some examples of tags:
+* [happy]
+* [energetic]
+* [excited]
+* [thoughtful]
+* [sarcastic]
+* [curious]
+* [mischievously]
+* [annoyed]
+* [woo]
+* [chuckles]
+* [snorts]
+* [laughs]
+* [laughs harder]
+* [starts laughing]
+* [exhales sharply]
+* [pauses]
+* [stammers]
+* [rushed]
+* [gasp]
+* [sigh]
+* [gulps]
+* [whispering]
+* [shouting]
+* [quietly]
+* [loudly]"""
+
+
+@functools.lru_cache(maxsize=1)
+def get_token_encoder():
+    """Get the tiktoken encoder for the generation model (None if tiktoken isn't installed)."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-5")
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens_uncached(text: str) -> int:
+    """
+    Count tokens in per-request text (pitches, user messages).
+    Falls back to a ~4 characters per token estimate without tiktoken.
+    """
+    encoder = get_token_encoder()
+    if encoder is None:
+        return len(text) // 4
+    return len(encoder.encode(text))
+
+
+@functools.lru_cache(maxsize=64)
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in static text, memoized so system prompts are tokenized once.
+    
+    Use count_tokens_uncached for per-request text so it doesn't evict them.
+    """
+    return count_tokens_uncached(text)
+
+
+class ResponseCache:
+    """
+    Exact-match cache of generated responses.
+    
+    Entries live in an in-memory LRU and, when a Redis URL is configured, in
+    Redis with a TTL, so they are shared by every worker process and survive
+    restarts. Entries older than ttl_seconds are ignored.
+    """
+    
+    # Prefix of the Redis keys holding cached responses
+    REDIS_KEY_PREFIX = "response_cache:"
+    
+    # How long Redis is skipped after it fails to respond (seconds), so an
+    # unreachable server doesn't add a timeout to every request
+    REDIS_RETRY_SECONDS = 60
+    
+    def __init__(self, redis_url: Optional[str] = None, max_size: int = 1024, ttl_seconds: int = 86400):
+        self.redis_url = redis_url
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+        self._redis_down_until = 0.0
+    
+    @staticmethod
+    def make_key(request: Dict[str, Any], response_type: str) -> str:
+        """Hash the full request exactly, so any difference in its arguments is a different entry."""
+        payload = json.dumps({"type": response_type, "request": request}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _get_redis(self):
+        """Get the Redis client, or None if Redis isn't configured or recently failed."""
+        if not self.redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            import redis
+            self._redis = redis.Redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1
+            )
+        return self._redis
+    
+    def _redis_failed(self, e: Exception) -> None:
+        """Skip Redis for a while after an error."""
+        self._redis_down_until = time.monotonic() + self.REDIS_RETRY_SECONDS
+        logger.warning(f"⚠️  WARNING: Response cache Redis unavailable: {str(e)}")
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a response in memory, then in Redis."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, result = entry
+                if time.time() - stored_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    return {**result, "cached": True}
+                del self._entries[key]
+        
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            data = client.get(self.REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+        if data is None:
+            return None
+        
+        # Redis expires entries itself; the remaining TTL isn't tracked, so
+        # the local copy is kept for a full TTL at most
+        result = json.loads(data)
+        with self._lock:
+            self._remember(key, (time.time(), result))
+        return {**result, "cached": True}
+    
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Save a response in memory and in Redis."""
+        entry = (time.time(), dict(result))
+        with self._lock:
+            self._remember(key, entry)
+        
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            client.set(self.REDIS_KEY_PREFIX + key, json.dumps(entry[1]), ex=self.ttl_seconds)
+        except Exception as e:
+            self._redis_failed(e)
+    
+    def _remember(self, key: str, entry: tuple) -> None:
+        """Add an entry to the in-memory LRU (caller holds the lock)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class RateLimiter:
+    """
+    Client-side requests-per-minute and tokens-per-minute limiter.
+    
+    Both budgets refill continuously over a minute. Each request reserves one
+    request and its estimated token cost before it is sent, and waits until
+    the budgets cover it, so bursts queue locally instead of triggering 429
+    retry storms. A limit of 0 disables that budget.
+    
+    Budgets are per process: with several server workers, give each its
+    share of the account's limits (see _worker_share).
+    """
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        """Top up both budgets for the time elapsed (caller holds the lock)."""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60)
+        self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+    
+    def _reserve(self, tokens: int) -> float:
+        """Reserve capacity for one request and return how long to wait before sending it."""
+        with self._lock:
+            self._refill()
+            wait = 0.0
+            if self.requests_per_minute:
+                self._requests -= 1
+                if self._requests < 0:
+                    wait = -self._requests * 60 / self.requests_per_minute
+            if self.tokens_per_minute:
+                # A request larger than the whole budget still goes through eventually
+                self._tokens -= min(tokens, self.tokens_per_minute)
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * 60 / self.tokens_per_minute)
+            return wait
+    
+    def acquire(self, tokens: int) -> None:
+        """Block until a request costing the given tokens may be sent."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.info(f"🚦 Rate limit reached, waiting {wait:.2f}s")
+            time.sleep(wait)
+    
+    async def aacquire(self, tokens: int) -> None:
+        """Async version of acquire; waits without blocking the event loop."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.info(f"🚦 Rate limit reached, waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+    
+    def update_from_headers(self, headers) -> None:
+        """Lower the budgets to what the API reports as remaining."""
+        with self._lock:
+            self._refill()
+            try:
+                remaining_requests = headers.get("x-ratelimit-remaining-requests")
+                if self.requests_per_minute and remaining_requests is not None:
+                    self._requests = min(self._requests, float(remaining_requests))
+                remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+                if self.tokens_per_minute and remaining_tokens is not None:
+                    self._tokens = min(self._tokens, float(remaining_tokens))
+            except ValueError:
+                pass
+
+
+def _worker_share(limit: int) -> int:
+    """Get one worker process's share of an account-wide limit (0 stays disabled)."""
+    if not limit:
+        return 0
+    return max(1, limit // max(1, Config.WORKERS))
+
+
+# Shared by all generators in the process
+response_cache = ResponseCache(Config.CACHE_REDIS_URL, ttl_seconds=Config.CACHE_TTL_SECONDS)
+rate_limiter = RateLimiter(_worker_share(Config.OPENAI_RPM_LIMIT), _worker_share(Config.OPENAI_TPM_LIMIT))
+
+# Identical requests currently waiting on the API, keyed by cache key, so
+# concurrent duplicates share one upstream call ("single-flight")
+_in_flight: Dict[str, concurrent.futures.Future] = {}
+_async_in_flight: Dict[str, asyncio.Task] = {}
+_in_flight_lock = threading.Lock()
+
+# OpenAI clients, created on first use and shared by all generators
+_openai_client = None
+_async_openai_client = None
+_openai_client_lock = threading.Lock()
+
+
+class IncompleteResponseError(Exception):
+    """The model returned no usable text: empty, or cut off by max_completion_tokens before a full sentence."""
+
+
+def _trim_to_full_sentences(text: str) -> str:
+    """Cut text that was cut off back to the end of its last complete sentence ("" if none)."""
+    ends = [match.end() for match in SENTENCE_END.finditer(text + " ")]
+    return text[:ends[-1]].strip() if ends else ""
+
+
+def _make_http_client(openai):
+    """
+    Get an HTTP client for the sync OpenAI client.
+    
+    Idle connections are kept open for KEEPALIVE_SECONDS (httpx closes them
+    after 5s by default), so requests spaced out in time reuse a warm
+    connection instead of paying for a new TLS handshake.
+    """
+    import httpx
+    return openai.DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=KEEPALIVE_SECONDS
+        )
+    )
+
+
+def _make_async_http_client(openai):
+    """
+    Get an aiohttp-backed HTTP client for AsyncOpenAI.
+    
+    httpx's own async transport stalls as concurrency grows, so use the
+    SDK's aiohttp transport when it's installed (openai[aiohttp]) and fall
+    back to the default httpx client otherwise.
+    """
+    try:
+        return openai.DefaultAioHttpClient()
+    except (AttributeError, RuntimeError, ImportError):
+        return None
+
+
+def get_openai_client():
+    """
+    Get the process-wide OpenAI client.
+    
+    Slow requests are cut off after OPENAI_TIMEOUT seconds; timeouts,
+    connection errors, 429s and 5xx responses are retried by the SDK with
+    exponential backoff.
+    """
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            # Deferred so importing this module doesn't pull in the OpenAI SDK
+            import openai
+            _openai_client = openai.OpenAI(
+                api_key=Config.OPENAI_API_KEY,
+                timeout=Config.OPENAI_TIMEOUT,
+                max_retries=Config.OPENAI_MAX_RETRIES,
+                http_client=_make_http_client(openai)
+            )
+        return _openai_client
+
+
+def get_async_openai_client():
+    """Get the process-wide AsyncOpenAI client (same settings as get_openai_client)."""
+    global _async_openai_client
+    with _openai_client_lock:
+        if _async_openai_client is None:
+            import openai
+            _async_openai_client = openai.AsyncOpenAI(
+                api_key=Config.OPENAI_API_KEY,
+                timeout=Config.OPENAI_TIMEOUT,
+                max_retries=Config.OPENAI_MAX_RETRIES,
+                http_client=_make_async_http_client(openai)
+            )
+        return _async_openai_client
+
+
 class HotTakeGenerator:
+    # Used when the Chad prompt file cannot be loaded
+    _FALLBACK_PROMPT = """You are "Chad Goldstein, General Partner at Bling Capital Partners" — a flamboyant, self-congratulatory, and unreasonably confident venture capitalist who delivers pitch and pitch deck critiques with a mix of ruthless candor, misguided self-comparisons to Warren Buffett, and unfiltered tech-bro energy.
+
+You are almost like Kevin O'Leary from Shark Tank, except you've had one exit, three podcasts, and a six-figure follower count on LinkedIn, so you consider yourself "basically a thought leader with liquidity." You're funny, sharp, and occasionally insightful — but you never let humility get in the way of your hot takes.
+
+Format your response like an investor-style commentary:
+* Opening one-liner or metaphor-heavy quip
+* Highlights — what works in the pitch and deck
+* Roast — what's questionable, missing, or overhyped
+* Closing — your "verdict"
+
+Stay in character the entire time. Be witty, self-deluded, and entertaining."""
+    
+    # Class-level cache of the Chad prompt file, keyed on (mtime, size)
+    _chad_prompt_key = None
+    _chad_prompt_cache = None
+    
+    # Extra system instructions for quick roasts
+    ROAST_SYSTEM_EXTRA = "Keep this response short and punchy - just 2-3 sentences max."
+    
+    # Caps on the spoken output, sized from its length (seconds x ~3 words/s
+    # x ~1.3 tokens/word, rounded up). Requests add REASONING_TOKEN_ALLOWANCE
+    # on top, as reasoning tokens count toward the same cap
+    HOT_TAKE_MAX_TOKENS = 120
+    ROAST_MAX_TOKENS = 80
+    
+    # Default reasoning effort per response type; creative one-liners gain
+    # nothing from hidden reasoning tokens, which only add latency, and
+    # minimal effort keeps the cap (and so the worst-case latency) tight
+    REASONING_EFFORT = {
+        "hot_take": "minimal",
+        "roast": "minimal"
+    }
+    
+    # How long a successful network connection test is trusted (seconds)
+    CONNECTION_CHECK_TTL = 300
+    _connection_verified_at = None
+    
+    # Minimal request used by the live connection test
+    CONNECTION_TEST_REQUEST = {
+        "model": "gpt-5",
+        "messages": [{"role": "user", "content": "Test"}],
+        "verbosity": "low",
+        "reasoning_effort": "minimal",
+        "max_completion_tokens": 50,
+        "service_tier": "default"
+    }
+    
     def __init__(self):
-        self.client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
+        # Clients are shared process-wide so every generator reuses one warm connection pool
+        self.client = get_openai_client()
+        # Async client for callers running inside an event loop (web API, batches)
+        self.async_client = get_async_openai_client()
     
     def _get_persona_prompt(self, persona_id: str = "chad_goldstein") -> str:
         """Get the persona's prompt content."""
@@ -17,7 +456,8 @@ class HotTakeGenerator:
         # Fallback to Chad's prompt if persona not found
         return self._load_chad_prompt()
     
-    def _load_chad_prompt(self) -> str:
+    @classmethod
+    def _load_chad_prompt(cls) -> str:
         """Load the Chad Goldstein character prompt from file."""
         try:
             # Try to get Chad's prompt from persona manager first
@@ -25,40 +465,200 @@ class HotTakeGenerator:
             if prompt_content:
                 return prompt_content
             
-            # Fallback to direct file read
-            with open("personas/prompts/chad_goldstein.txt", "r", encoding="utf-8") as f:
-                prompt = f.read().strip()
-                if not prompt:
-                    print("⚠️  WARNING: personas/prompts/chad_goldstein.txt file is empty!")
-                    return self._get_fallback_prompt()
-                return prompt
+            # Fallback to direct file read, only re-reading when the file changes
+            st = os.stat(CHAD_PROMPT_FILE)
+            key = (st.st_mtime_ns, st.st_size)
+            if cls._chad_prompt_key != key:
+                with open(CHAD_PROMPT_FILE, "r", encoding="utf-8") as f:
+                    cls._chad_prompt_cache = f.read().strip()
+                cls._chad_prompt_key = key
+            
+            prompt = cls._chad_prompt_cache
+            if not prompt:
+                logger.warning("⚠️  WARNING: personas/prompts/chad_goldstein.txt file is empty!")
+                return cls._FALLBACK_PROMPT
+            return prompt
         except FileNotFoundError:
-            print("⚠️  WARNING: personas/prompts/chad_goldstein.txt file not found! Using fallback prompt.")
-            return self._get_fallback_prompt()
+            logger.warning("⚠️  WARNING: personas/prompts/chad_goldstein.txt file not found! Using fallback prompt.")
+            return cls._FALLBACK_PROMPT
         except Exception as e:
-            print(f"⚠️  WARNING: Error loading personas/prompts/chad_goldstein.txt: {str(e)}. Using fallback prompt.")
-            return self._get_fallback_prompt()
+            logger.warning(f"⚠️  WARNING: Error loading personas/prompts/chad_goldstein.txt: {str(e)}. Using fallback prompt.")
+            return cls._FALLBACK_PROMPT
     
     def _get_fallback_prompt(self) -> str:
         """Get a fallback prompt if the main prompt file cannot be loaded."""
-        return """You are "Chad Goldstein, General Partner at Bling Capital Partners" — a flamboyant, self-congratulatory, and unreasonably confident venture capitalist who delivers pitch and pitch deck critiques with a mix of ruthless candor, misguided self-comparisons to Warren Buffett, and unfiltered tech-bro energy.
-
-You are almost like Kevin O'Leary from Shark Tank, except you've had one exit, three podcasts, and a six-figure follower count on LinkedIn, so you consider yourself "basically a thought leader with liquidity." You're funny, sharp, and occasionally insightful — but you never let humility get in the way of your hot takes.
-
-Format your response like an investor-style commentary:
-* Opening one-liner or metaphor-heavy quip
-* Highlights — what works in the pitch and deck
-* Roast — what's questionable, missing, or overhyped
-* Closing — your "verdict"
-
-Stay in character the entire time. Be witty, self-deluded, and entertaining."""
+        return self._FALLBACK_PROMPT
+    
+    def _prepare_request(self,
+                         user_message: str,
+                         persona_id: str = "chad_goldstein",
+                         system_extra: str = "",
+                         audio_tags: bool = False,
+                         max_completion_tokens: Optional[int] = None,
+                         reasoning_effort: Optional[str] = None,
+                         tier: Optional[str] = "priority") -> Dict[str, Any]:
+        """
+        Build the chat.completions.create arguments for a request.
+        
+        Args:
+            user_message: The complete user message to send to the API
+            persona_id: Persona ID to use
+            system_extra: Extra instructions for the system message
+            audio_tags: Whether to include audio tags for dramatic effect
+            max_completion_tokens: Cap on visible output tokens (None for no cap);
+                the request's cap adds the reasoning allowance for the effort
+            reasoning_effort: GPT-5 reasoning effort (None for the API default)
+            tier: OpenAI service tier. "priority" gives the lowest, most
+                consistent latency at a premium price; "default" is cheaper
+                and fine when nobody is waiting on the result; None omits it
+            
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        # Get persona information
+        persona = persona_manager.get_persona(persona_id)
+        if not persona:
+            logger.warning(f"⚠️  WARNING: Persona '{persona_id}' not found. Using Chad Goldstein as fallback.")
+            persona_id = "chad_goldstein"
+            persona = persona_manager.get_persona(persona_id)
+        
+        # Get persona's prompt
+        persona_prompt = self._get_persona_prompt(persona_id)
+        
+        system_message = self._build_system_message(persona_prompt, system_extra, audio_tags)
+        
+        request = {
+            "model": "gpt-5",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system_message
+                },
+                {
+                    "role": "user", 
+                    "content": user_message
+                }
+            ],
+            "verbosity": "low"
+        }
+        if tier:
+            request["service_tier"] = tier
+        if max_completion_tokens:
+            request["max_completion_tokens"] = (
+                max_completion_tokens
+                + REASONING_TOKEN_ALLOWANCE.get(reasoning_effort, REASONING_TOKEN_ALLOWANCE[None])
+            )
+        if reasoning_effort:
+            request["reasoning_effort"] = reasoning_effort
+        return request
+    
+    @staticmethod
+    def _build_system_message(persona_prompt: str, system_extra: str = "", audio_tags: bool = False) -> str:
+        """
+        Construct the system message: persona, then the static formatting rules,
+        then any extra instructions, so the shared prefix stays as long as possible.
+        """
+        system_message = f"{persona_prompt}\n\n{SPEECH_RULES}"
+        if audio_tags:
+            system_message += f"\n\n{AUDIO_TAGS}"
+        if system_extra:
+            system_message += f"\n\n{system_extra}"
+        return system_message
+    
+    def precompute_static_token_counts(self) -> None:
+        """
+        Tokenize every persona's possible system messages ahead of time.
+        
+        System messages only vary by persona, audio tags and response type, so
+        after this only the user message is tokenized per request.
+        """
+        for persona_id in list(persona_manager.personas):
+            persona_prompt = self._get_persona_prompt(persona_id)
+            for system_extra in ("", self.ROAST_SYSTEM_EXTRA):
+                for audio_tags in (False, True):
+                    count_tokens(self._build_system_message(persona_prompt, system_extra, audio_tags))
+    
+    def _estimate_tokens(self, request: Dict[str, Any]) -> int:
+        """Estimate a request's token cost (prompt plus expected output) for rate limiting."""
+        system_message, user_message = request["messages"]
+        prompt_tokens = count_tokens(system_message["content"]) + count_tokens_uncached(user_message["content"])
+        return prompt_tokens + request.get("max_completion_tokens", ESTIMATED_OUTPUT_TOKENS)
+    
+    def _build_result(self, response, request: Dict[str, Any], response_type: str, latency: float) -> Dict[str, Any]:
+        """
+        Convert an API response into the result dictionary and log latency.
+        
+        Args:
+            response: ChatCompletion returned by the API
+            request: Arguments the request was made with
+            response_type: Type of response ("hot_take" or "roast")
+            latency: Request latency in seconds
+            
+        Returns:
+            Dictionary with response data
+            
+        A response cut off by max_completion_tokens is trimmed back to its
+        last complete sentence rather than retried with a larger cap, which
+        would double the worst-case latency.
+        
+        Raises:
+            IncompleteResponseError: If the response is empty, or was cut off
+                before its first sentence ended
+        """
+        # Determine the result key based on response type
+        result_key = "roast" if response_type == "roast" else "hot_take"
+        
+        choice = response.choices[0] if response.choices else None
+        content = (choice.message.content or "").strip() if choice else ""
+        finish_reason = choice.finish_reason if choice else None
+        if finish_reason == "length":
+            logger.warning(f"⚠️  WARNING: {response_type} response was cut off by max_completion_tokens; trimming it to full sentences")
+            content = _trim_to_full_sentences(content)
+        if not content:
+            raise IncompleteResponseError(
+                f"{response_type} response was empty or cut off before its first sentence ended "
+                f"(finish_reason={finish_reason}, max_completion_tokens={request.get('max_completion_tokens')})"
+            )
+        
+        result = {
+            result_key: content,
+            "latency_seconds": latency,
+            "input_tokens": response.usage.prompt_tokens if response.usage else None,
+            "output_tokens": response.usage.completion_tokens if response.usage else None,
+            "total_tokens": response.usage.total_tokens if response.usage else None,
+            "system_prompt_tokens": count_tokens(request["messages"][0]["content"]),
+            "model": response.model,
+            "finish_reason": finish_reason
+        }
+        
+        # Log latency information
+        log_prefix = "Quick Roast" if response_type == "roast" else "Hot Take"
+        logger.info(
+            f"⏱️  OpenAI API Latency ({log_prefix}): {latency:.2f}s",
+            extra={"response_type": response_type, "latency": latency}
+        )
+        if response.usage:
+            logger.info(
+                f"📊 Tokens: {result['input_tokens']} input, {result['output_tokens']} output, {result['total_tokens']} total",
+                extra={
+                    "input_tokens": result["input_tokens"],
+                    "output_tokens": result["output_tokens"],
+                    "total_tokens": result["total_tokens"]
+                }
+            )
+        
+        return result
     
     def _generate_response(self, 
                           input_text: str, 
                           user_message: str,
                           response_type: str = "hot_take",
                           persona_id: str = "chad_goldstein",
-                          system_extra: str = "") -> Dict[str, Any]:
+                          system_extra: str = "",
+                          audio_tags: bool = False,
+                          max_completion_tokens: Optional[int] = None,
+                          reasoning_effort: Optional[str] = None,
+                          tier: str = "priority") -> Dict[str, Any]:
         """
         Common method to generate responses using OpenAI API.
         
@@ -68,75 +668,150 @@ Stay in character the entire time. Be witty, self-deluded, and entertaining."""
             response_type: Type of response ("hot_take" or "roast")
             persona_id: Persona ID to use
             system_extra: Extra instructions for the system message
+            audio_tags: Whether to include audio tags for dramatic effect
+            max_completion_tokens: Hard cap on generated tokens (None for no cap)
+            reasoning_effort: GPT-5 reasoning effort; defaults to REASONING_EFFORT
+                for the response type, pass a higher effort for deeper analysis
+            tier: OpenAI service tier ("priority" for interactive requests,
+                "default" for background work that can tolerate more latency)
             
         Returns:
             Dictionary with response data
         """
-        # Get persona information
-        persona = persona_manager.get_persona(persona_id)
-        if not persona:
-            print(f"⚠️  WARNING: Persona '{persona_id}' not found. Using Chad Goldstein as fallback.")
-            persona_id = "chad_goldstein"
-            persona = persona_manager.get_persona(persona_id)
+        request = self._prepare_request(
+            user_message,
+            persona_id,
+            system_extra,
+            audio_tags,
+            max_completion_tokens,
+            reasoning_effort or self.REASONING_EFFORT.get(response_type),
+            tier
+        )
         
-        # Get persona's prompt
-        persona_prompt = self._get_persona_prompt(persona_id)
+        cache_key = response_cache.make_key(request, response_type)
+        if not Config.DISABLE_CACHE:
+            cached = response_cache.get(cache_key)
+            if cached:
+                logger.info("⚡ Using cached response")
+                return cached
+        
+        # Wait on an identical request that's already in flight instead of repeating it
+        with _in_flight_lock:
+            pending = _in_flight.get(cache_key)
+            if pending is None:
+                future = concurrent.futures.Future()
+                _in_flight[cache_key] = future
+        if pending is not None:
+            logger.info("⚡ Waiting for identical in-flight request")
+            return pending.result()
+        
+        try:
+            result = self._call_api(request, response_type, cache_key)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _in_flight_lock:
+                _in_flight.pop(cache_key, None)
+    
+    def _send_request(self, request: Dict[str, Any], response_type: str) -> Dict[str, Any]:
+        """Send one request to the API and build its result."""
+        rate_limiter.acquire(self._estimate_tokens(request))
+        start_time = time.time()
+        raw_response = self.client.chat.completions.with_raw_response.create(**request)
+        rate_limiter.update_from_headers(raw_response.headers)
+        response = raw_response.parse()
+        return self._build_result(response, request, response_type, time.time() - start_time)
+    
+    def _call_api(self, request: Dict[str, Any], response_type: str, cache_key: str) -> Dict[str, Any]:
+        """
+        Send a request to the API, then build and cache its result.
         
+        An incomplete response raises rather than being returned or cached.
+        """
         start_time = time.time()
         
         try:
-            # Construct system message with any extra instructions
-            system_message = persona_prompt
-            if system_extra:
-                system_message += f"\n\n{system_extra}"
-            
-            response = self.client.chat.completions.create(
-                model="gpt-5",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_message
-                    },
-                    {
-                        "role": "user", 
-                        "content": user_message
-                    }
-                ],
-                verbosity="low",
-                service_tier="priority"
-            )
+            result = self._send_request(request, response_type)
+            if not Config.DISABLE_CACHE:
+                response_cache.set(cache_key, result)
+            return result
             
+        except Exception as e:
             end_time = time.time()
             latency = end_time - start_time
-            
-            # Determine the result key based on response type
-            result_key = "roast" if response_type == "roast" else "hot_take"
-            
-            result = {
-                result_key: response.choices[0].message.content.strip(),
-                "latency_seconds": latency,
-                "input_tokens": response.usage.prompt_tokens if response.usage else None,
-                "output_tokens": response.usage.completion_tokens if response.usage else None,
-                "total_tokens": response.usage.total_tokens if response.usage else None,
-                "model": response.model,
-                "finish_reason": response.choices[0].finish_reason if response.choices else None
-            }
-            
-            # Log latency information
-            log_prefix = "Quick Roast" if response_type == "roast" else "Hot Take"
-            print(f"⏱️  OpenAI API Latency ({log_prefix}): {latency:.2f}s")
-            if response.usage:
-                print(f"📊 Tokens: {result['input_tokens']} input, {result['output_tokens']} output, {result['total_tokens']} total")
-            
+            logger.error(f"❌ OpenAI API Error after {latency:.2f}s: {str(e)}")
+            raise Exception(f"Failed to generate {response_type}: {str(e)}")
+    
+    async def _agenerate_response(self,
+                                  input_text: str,
+                                  user_message: str,
+                                  response_type: str = "hot_take",
+                                  persona_id: str = "chad_goldstein",
+                                  system_extra: str = "",
+                                  audio_tags: bool = False,
+                                  max_completion_tokens: Optional[int] = None,
+                                  reasoning_effort: Optional[str] = None,
+                                  tier: str = "priority") -> Dict[str, Any]:
+        """Async version of _generate_response using the AsyncOpenAI client."""
+        request = self._prepare_request(
+            user_message,
+            persona_id,
+            system_extra,
+            audio_tags,
+            max_completion_tokens,
+            reasoning_effort or self.REASONING_EFFORT.get(response_type),
+            tier
+        )
+        
+        cache_key = response_cache.make_key(request, response_type)
+        if not Config.DISABLE_CACHE:
+            cached = await asyncio.to_thread(response_cache.get, cache_key)
+            if cached:
+                logger.info("⚡ Using cached response")
+                return cached
+        
+        # Share the task of an identical request that's already in flight
+        with _in_flight_lock:
+            task = _async_in_flight.get(cache_key)
+            if task is None:
+                task = asyncio.create_task(self._acall_api(request, response_type, cache_key))
+                _async_in_flight[cache_key] = task
+                task.add_done_callback(lambda _: _async_in_flight.pop(cache_key, None))
+            else:
+                logger.info("⚡ Waiting for identical in-flight request")
+        
+        # Shielded so one caller being cancelled doesn't cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _asend_request(self, request: Dict[str, Any], response_type: str) -> Dict[str, Any]:
+        """Async version of _send_request."""
+        await rate_limiter.aacquire(self._estimate_tokens(request))
+        start_time = time.time()
+        raw_response = await self.async_client.chat.completions.with_raw_response.create(**request)
+        rate_limiter.update_from_headers(raw_response.headers)
+        response = raw_response.parse()
+        return self._build_result(response, request, response_type, time.time() - start_time)
+    
+    async def _acall_api(self, request: Dict[str, Any], response_type: str, cache_key: str) -> Dict[str, Any]:
+        """Async version of _call_api."""
+        start_time = time.time()
+        
+        try:
+            result = await self._asend_request(request, response_type)
+            if not Config.DISABLE_CACHE:
+                await asyncio.to_thread(response_cache.set, cache_key, result)
             return result
             
         except Exception as e:
             end_time = time.time()
             latency = end_time - start_time
-            print(f"❌ OpenAI API Error after {latency:.2f}s: {str(e)}")
+            logger.error(f"❌ OpenAI API Error after {latency:.2f}s: {str(e)}")
             raise Exception(f"Failed to generate {response_type}: {str(e)}")
     
-    def _build_user_message(self, input_text: str, response_type: str, context: Optional[str] = None, persona_name: str = "Chad", max_duration: str = "20 seconds", audio_tags: bool = False) -> str:
+    def _build_user_message(self, input_text: str, response_type: str, context: Optional[str] = None, persona_name: str = "Chad", max_duration: str = "20 seconds") -> str:
         """
         Build the user message for the API call.
         
@@ -146,134 +821,402 @@ Stay in character the entire time. Be witty, self-deluded, and entertaining."""
             context: Optional additional context
             persona_name: Name of the persona
             max_duration: Maximum duration for the response
-            audio_tags: Whether to include audio tags for dramatic effect
             
         Returns:
             Complete user message string
         """
-        # Build the base message based on response type
+        # Speech rules and audio tags live in the system message; the user
+        # message only carries the request itself
         if response_type == "hot_take":
-            user_message = f"Here's a startup pitch I just heard:\n\n{input_text}"
+            parts = [
+                f"Give me your hot take, {persona_name}! Keep it to {max_duration} MAX.",
+                f"Here's a startup pitch I just heard:\n\n{input_text}"
+            ]
             if context:
-                user_message += f"\n\nAdditional context: {context}"
-            user_message += f"\n\nGive me your hot take, {persona_name}! Keep it to {max_duration} MAX."
+                parts.append(f"Additional context: {context}")
         else:  # roast
-            user_message = f"Give me a quick hot take roast about: {input_text}"
-            user_message += f"\n\nKeep it to {max_duration} MAX."
+            parts = [
+                f"Keep it to {max_duration} MAX.",
+                f"Give me a quick hot take roast about: {input_text}"
+            ]
         
-        # Add common speech formatting instructions
-        user_message += f"""
-
-Be sure to generate only the spoken words. Generate sentences that sound natural when spoken.
-Incorporate Punctuation Marks:
-* Commas (,): Create shorter breaks.
-* Periods (.): Introduce longer breaks with downward inflection.
-
-Write out numbers and avoid abbreviations for clarity. For example:
-* "2012" becomes "twenty twelve."
-* "3/8" becomes "three eighths of an inch."
-* "01:18" becomes "one minute and eighteen seconds."
-* "10-19-2016" becomes "October nineteenth, two thousand sixteen."
-* "150th CT NE, Redmond, WA" becomes "150th Court Northeast, Redmond, Washington."
-
-Replace acronyms with their sounded-out versions, like "AI" (as "a-eye") or "AWS" (as "a-double you-s")."""
-        
-        # Add audio tags instruction if requested
-        if audio_tags:
-            user_message += f"""
-
-Add audio tags in square brackets to make it sound more realistic and for dramatic effect. Some examples of tags:
-* [happy]
-* [energetic]
-* [excited]
-* [thoughtful]
-* [sarcastic]
-* [curious]
-* [mischievously]
-* [annoyed]
-* [woo]
-* [chuckles]
-* [snorts]
-* [laughs]
-* [laughs harder]
-* [starts laughing]
-* [exhales sharply]
-* [pauses]
-* [stammers]
-* [rushed]
-* [gasp]
-* [sigh]
-* [gulps]
-* [whispering]
-* [shouting]
-* [quietly]
-* [loudly]
-"""
+        user_message = "\n\n".join(parts)
         
         return user_message
     
-    def generate_hot_take(self, pitch_transcript: str, context: Optional[str] = None, persona_id: str = "chad_goldstein", audio_tags: bool = False) -> Dict[str, Any]:
-        """Generate a hot take response based on the pitch transcript."""
+    def _hot_take_message(self, pitch_transcript: str, context: Optional[str], persona_id: str) -> str:
+        """Build the user message for a hot take."""
         # Get persona for name
         persona = persona_manager.get_persona(persona_id)
         persona_name = persona.name if persona else "Chad"
         
-        user_message = self._build_user_message(
+        return self._build_user_message(
             input_text=pitch_transcript,
             response_type="hot_take",
             context=context,
             persona_name=persona_name,
-            max_duration="20 seconds",
-            audio_tags=audio_tags
+            max_duration="20 seconds"
         )
+    
+    def generate_hot_take(self, pitch_transcript: str, context: Optional[str] = None, persona_id: str = "chad_goldstein", audio_tags: bool = False) -> Dict[str, Any]:
+        """Generate a hot take response based on the pitch transcript."""
+        user_message = self._hot_take_message(pitch_transcript, context, persona_id)
         
         return self._generate_response(
             input_text=pitch_transcript,
             user_message=user_message,
             response_type="hot_take",
-            persona_id=persona_id
+            persona_id=persona_id,
+            audio_tags=audio_tags,
+            max_completion_tokens=self.HOT_TAKE_MAX_TOKENS
         )
     
-    def generate_quick_roast(self, topic: str, persona_id: str = "chad_goldstein", audio_tags: bool = False) -> Dict[str, Any]:
-        """Generate a quick roast on any topic."""
+    async def agenerate_hot_take(self, pitch_transcript: str, context: Optional[str] = None, persona_id: str = "chad_goldstein", audio_tags: bool = False) -> Dict[str, Any]:
+        """Async version of generate_hot_take; doesn't block the event loop."""
+        user_message = self._hot_take_message(pitch_transcript, context, persona_id)
+        
+        return await self._agenerate_response(
+            input_text=pitch_transcript,
+            user_message=user_message,
+            response_type="hot_take",
+            persona_id=persona_id,
+            audio_tags=audio_tags,
+            max_completion_tokens=self.HOT_TAKE_MAX_TOKENS
+        )
+    
+    async def generate_hot_take_stream(self, pitch_transcript: str, context: Optional[str] = None, persona_id: str = "chad_goldstein", audio_tags: bool = False) -> AsyncIterator[str]:
+        """
+        Stream a hot take one sentence at a time.
+        
+        Sentences are yielded as soon as the model finishes them, so speech
+        synthesis can start on the first sentence while the rest is still
+        being generated. Use generate_hot_take when the full result dict
+        (token counts, caching) is needed.
+        
+        Yields:
+            Complete sentences of the hot take, in order
+        """
+        user_message = self._hot_take_message(pitch_transcript, context, persona_id)
+        request = self._prepare_request(
+            user_message,
+            persona_id,
+            audio_tags=audio_tags,
+            max_completion_tokens=self.HOT_TAKE_MAX_TOKENS,
+            reasoning_effort=self.REASONING_EFFORT["hot_take"]
+        )
+        
+        await rate_limiter.aacquire(self._estimate_tokens(request))
+        start_time = time.time()
+        first_sentence_at = None
+        buffer = ""
+        finish_reason = None
+        
+        try:
+            stream = await self.async_client.chat.completions.create(**request, stream=True)
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                buffer += chunk.choices[0].delta.content or ""
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+                
+                # Yield every complete sentence in the buffer
+                match = SENTENCE_END.search(buffer)
+                while match:
+                    sentence, buffer = buffer[:match.end()].strip(), buffer[match.end():]
+                    if sentence:
+                        if first_sentence_at is None:
+                            first_sentence_at = time.time()
+                            logger.info(f"⏱️  OpenAI First Sentence Latency (Hot Take): {first_sentence_at - start_time:.2f}s")
+                        yield sentence
+                    match = SENTENCE_END.search(buffer)
+            
+            # A cut-off response ends at its last complete sentence, dropping
+            # the partial one; otherwise whatever is left is the final sentence
+            if finish_reason == "length":
+                logger.warning("⚠️  WARNING: hot_take response was cut off by max_completion_tokens; ending at its last full sentence")
+                buffer = _trim_to_full_sentences(buffer)
+            if buffer.strip():
+                yield buffer.strip()
+            elif first_sentence_at is None:
+                raise IncompleteResponseError(
+                    f"hot_take response was empty or cut off before its first sentence ended "
+                    f"(finish_reason={finish_reason}, max_completion_tokens={request.get('max_completion_tokens')})"
+                )
+            
+            logger.info(f"⏱️  OpenAI API Latency (Hot Take Stream): {time.time() - start_time:.2f}s")
+            
+        except Exception as e:
+            end_time = time.time()
+            latency = end_time - start_time
+            logger.error(f"❌ OpenAI API Error after {latency:.2f}s: {str(e)}")
+            raise Exception(f"Failed to generate hot_take: {str(e)}")
+    
+    async def generate_hot_take_batch(self, pitches: List[Union[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Generate hot takes for several pitches concurrently.
+        
+        Args:
+            pitches: Pitch transcripts, or dicts of agenerate_hot_take keyword
+                arguments (pitch_transcript, context, persona_id, audio_tags)
+            
+        Returns:
+            Results in the same order as the pitches
+        """
+        return await asyncio.gather(*(
+            self.agenerate_hot_take(**pitch) if isinstance(pitch, dict) else self.agenerate_hot_take(pitch)
+            for pitch in pitches
+        ))
+    
+    def submit_batch(self, pitches: List[Union[str, Dict[str, Any]]]) -> str:
+        """
+        Submit hot takes for offline generation through the OpenAI Batch API.
+        
+        Batch requests cost half as much as realtime ones but complete within
+        24 hours, so this is only for non-interactive workloads (demos, tests).
+        
+        Args:
+            pitches: Pitch transcripts, or dicts of generate_hot_take keyword
+                arguments (pitch_transcript, context, persona_id, audio_tags)
+            
+        Returns:
+            The batch ID, for wait_for_batch
+        """
+        lines = []
+        for index, pitch in enumerate(pitches):
+            if not isinstance(pitch, dict):
+                pitch = {"pitch_transcript": pitch}
+            persona_id = pitch.get("persona_id", "chad_goldstein")
+            user_message = self._hot_take_message(pitch["pitch_transcript"], pitch.get("context"), persona_id)
+            body = self._prepare_request(
+                user_message,
+                persona_id,
+                audio_tags=pitch.get("audio_tags", False),
+                max_completion_tokens=self.HOT_TAKE_MAX_TOKENS,
+                reasoning_effort=self.REASONING_EFFORT["hot_take"],
+                # Batch jobs run on their own schedule, so priority processing buys nothing
+                tier=None
+            )
+            lines.append(json.dumps({
+                "custom_id": f"pitch-{index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+        
+        batch_file = self.client.files.create(
+            file=("hot_takes.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"📦 Submitted batch {batch.id} with {len(lines)} hot takes")
+        return batch.id
+    
+    def wait_for_batch(self, batch_id: str, poll_interval: float = 30) -> List[Dict[str, Any]]:
+        """
+        Wait for a batch from submit_batch to finish and parse its results.
+        
+        Args:
+            batch_id: ID returned by submit_batch
+            poll_interval: Seconds between status checks
+            
+        Returns:
+            Results in the same order as the submitted pitches; pitches that
+            failed (including empty or cut-off responses) have an "error" key
+            instead of "hot_take"
+        """
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in ("completed", "failed", "expired", "cancelled"):
+                break
+            time.sleep(poll_interval)
+        
+        if batch.status != "completed":
+            raise Exception(f"Batch {batch_id} ended with status '{batch.status}'")
+        
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                index = int(record["custom_id"].split("-", 1)[1])
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    results[index] = {"error": record.get("error") or response.get("body")}
+                    continue
+                
+                completion = response["body"]
+                choice = completion["choices"][0]
+                content = (choice["message"].get("content") or "").strip()
+                if choice.get("finish_reason") == "length":
+                    content = _trim_to_full_sentences(content)
+                if not content:
+                    results[index] = {"error": f"Response was empty or cut off before its first sentence ended (finish_reason={choice.get('finish_reason')})"}
+                    continue
+                
+                usage = completion.get("usage") or {}
+                results[index] = {
+                    "hot_take": content,
+                    "input_tokens": usage.get("prompt_tokens"),
+                    "output_tokens": usage.get("completion_tokens"),
+                    "total_tokens": usage.get("total_tokens"),
+                    "model": completion.get("model"),
+                    "finish_reason": choice.get("finish_reason")
+                }
+        
+        logger.info(f"📦 Batch {batch_id} completed: {len(results)} results")
+        return [
+            results.get(index, {"error": "No result returned"})
+            for index in range(batch.request_counts.total if batch.request_counts else len(results))
+        ]
+    
+    def generate_hot_takes_batch(self, pitches: List[Union[str, Dict[str, Any]]], poll_interval: float = 30) -> List[Dict[str, Any]]:
+        """
+        Generate hot takes through the Batch API and wait for the results.
+        
+        Use generate_hot_take (or generate_hot_take_batch) for interactive
+        requests; this path trades latency for cost.
+        """
+        return self.wait_for_batch(self.submit_batch(pitches), poll_interval)
+    
+    def _roast_message(self, topic: str, persona_id: str) -> str:
+        """Build the user message for a quick roast."""
         # Get persona for name
         persona = persona_manager.get_persona(persona_id)
         persona_name = persona.name if persona else "Chad"
         
-        user_message = self._build_user_message(
+        return self._build_user_message(
             input_text=topic,
             response_type="roast",
             persona_name=persona_name,
-            max_duration="15 seconds",
-            audio_tags=audio_tags
+            max_duration="15 seconds"
         )
-        
+    
+    def generate_quick_roast(self, topic: str, persona_id: str = "chad_goldstein", audio_tags: bool = False) -> Dict[str, Any]:
+        """Generate a quick roast on any topic."""
         return self._generate_response(
             input_text=topic,
-            user_message=user_message,
+            user_message=self._roast_message(topic, persona_id),
+            response_type="roast",
+            persona_id=persona_id,
+            system_extra=self.ROAST_SYSTEM_EXTRA,
+            audio_tags=audio_tags,
+            max_completion_tokens=self.ROAST_MAX_TOKENS
+        )
+    
+    async def agenerate_quick_roast(self, topic: str, persona_id: str = "chad_goldstein", audio_tags: bool = False) -> Dict[str, Any]:
+        """Async version of generate_quick_roast; doesn't block the event loop."""
+        return await self._agenerate_response(
+            input_text=topic,
+            user_message=self._roast_message(topic, persona_id),
             response_type="roast",
             persona_id=persona_id,
-            system_extra="Keep this response short and punchy - just 2-3 sentences max."
+            system_extra=self.ROAST_SYSTEM_EXTRA,
+            audio_tags=audio_tags,
+            max_completion_tokens=self.ROAST_MAX_TOKENS
         )
     
-    def test_connection(self) -> bool:
-        """Test the OpenAI API connection."""
+    def warmup(self) -> None:
+        """
+        Open a connection to the API ahead of the first real request.
+        
+        Nothing calls this implicitly; call it (or awarmup) at startup of a
+        long-running process that is about to serve requests.
+        
+        Fetches the model metadata (no tokens are used) so the TLS handshake
+        is already done when the first hot take is requested, then pre-computes
+        the system prompt token counts. Failures are ignored; the real request
+        will simply connect on its own.
+        """
         start_time = time.time()
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-5",
-                messages=[{"role": "user", "content": "Test"}],
-                verbosity="low",
-                reasoning_effort="minimal",
-                max_completion_tokens=50,
-                service_tier="priority"
-            )
+            self.client.models.retrieve("gpt-5")
+            logger.info(f"🔥 OpenAI connection warmed up in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            logger.warning(f"⚠️  WARNING: OpenAI connection warm-up failed: {str(e)}")
+        
+        self.precompute_static_token_counts()
+    
+    async def awarmup(self) -> None:
+        """Async version of warmup for the AsyncOpenAI client."""
+        start_time = time.time()
+        try:
+            await self.async_client.models.retrieve("gpt-5")
+            logger.info(f"🔥 OpenAI async connection warmed up in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            logger.warning(f"⚠️  WARNING: OpenAI async connection warm-up failed: {str(e)}")
+        
+        await asyncio.to_thread(self.precompute_static_token_counts)
+    
+    def _check_connection_offline(self, deep: bool) -> Optional[bool]:
+        """
+        Answer a connection test without the network when possible.
+        
+        Returns:
+            True/False if the answer is known, None if a live request is needed
+        """
+        api_key = Config.OPENAI_API_KEY
+        if not api_key or not api_key.startswith("sk-"):
+            logger.error("❌ OpenAI Connection Test Failed: OPENAI_API_KEY is missing or malformed")
+            return False
+        
+        if not deep:
+            return True
+        
+        last_ok = HotTakeGenerator._connection_verified_at
+        if last_ok and time.time() - last_ok < self.CONNECTION_CHECK_TTL:
+            return True
+        
+        return None
+    
+    def test_connection(self, deep: bool = True) -> bool:
+        """
+        Test the OpenAI API connection.
+        
+        The API key is validated offline first. When deep is True a minimal
+        request is also sent; a successful deep check is remembered for
+        CONNECTION_CHECK_TTL seconds so repeated checks in one process are free.
+        """
+        offline_result = self._check_connection_offline(deep)
+        if offline_result is not None:
+            return offline_result
+        
+        start_time = time.time()
+        try:
+            response = self.client.chat.completions.create(**self.CONNECTION_TEST_REQUEST)
+            end_time = time.time()
+            latency = end_time - start_time
+            logger.info(f"⏱️  OpenAI Connection Test Latency: {latency:.2f}s")
+            HotTakeGenerator._connection_verified_at = end_time
+            return True
+        except Exception as e:
+            end_time = time.time()
+            latency = end_time - start_time
+            logger.error(f"❌ OpenAI Connection Test Failed after {latency:.2f}s: {str(e)}")
+            return False
+    
+    async def atest_connection(self, deep: bool = True) -> bool:
+        """Async version of test_connection."""
+        offline_result = self._check_connection_offline(deep)
+        if offline_result is not None:
+            return offline_result
+        
+        start_time = time.time()
+        try:
+            response = await self.async_client.chat.completions.create(**self.CONNECTION_TEST_REQUEST)
             end_time = time.time()
             latency = end_time - start_time
-            print(f"⏱️  OpenAI Connection Test Latency: {latency:.2f}s")
+            logger.info(f"⏱️  OpenAI Connection Test Latency: {latency:.2f}s")
+            HotTakeGenerator._connection_verified_at = end_time
             return True
         except Exception as e:
             end_time = time.time()
             latency = end_time - start_time
-            print(f"❌ OpenAI Connection Test Failed after {latency:.2f}s: {str(e)}")
+            logger.error(f"❌ OpenAI Connection Test Failed after {latency:.2f}s: {str(e)}")
             return False
@@ -9,13 +9,17 @@ This script:
 4. Supports batch operations for efficiency
 """
 
+import io
 import os
+import re
 import sys
 import json
 import logging
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple, Iterator
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -33,9 +37,180 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Documents per batch commit. Firestore allows up to 500, but many small
+# batches committed in parallel finish sooner than a few large serial ones
+BATCH_SIZE = 50
+
+# Batch commits in flight at once (commits are network-bound, so threads suffice)
+COMMIT_WORKERS = 20
+
+# Documents read from the file, checked for conflicts and queued for writing
+# at a time
+READ_CHUNK_SIZE = 300
+
+# Bytes read from the file at a time. Large sequential reads mean far fewer
+# syscalls than the default 8 KiB buffer
+READ_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Whitespace allowed between JSON tokens
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Log import progress once per this many documents
+PROGRESS_INTERVAL = 1000
+
+
+def _iter_array_items(f) -> Iterator[Any]:
+    """
+    Yield the items of a JSON array one at a time using only the standard library.
+    
+    Reads the file in READ_BUFFER_SIZE pieces and parses each item with
+    JSONDecoder.raw_decode, so only the current piece is held in memory.
+    
+    Raises:
+        json.JSONDecodeError: If the array is malformed
+    """
+    decoder = json.JSONDecoder()
+    text = io.TextIOWrapper(f, encoding='utf-8')
+    buf = ''
+    pos = 0
+    eof = False
+    
+    def next_char() -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        nonlocal buf, pos, eof
+        while True:
+            pos = JSON_WHITESPACE.match(buf, pos).end()
+            if pos < len(buf) or eof:
+                return buf[pos:pos + 1]
+            buf, pos = text.read(READ_BUFFER_SIZE), 0
+            eof = not buf
+    
+    if next_char() != '[':
+        raise json.JSONDecodeError("Expecting '['", buf, pos)
+    pos += 1
+    if next_char() == ']':
+        return
+    
+    while True:
+        # Parse the next item, reading more of the file until it's followed by
+        # a delimiter (a number cut off at the end of the buffer, like "12."
+        # of "12.5", would otherwise parse as a shorter value)
+        next_char()
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+            following_at = JSON_WHITESPACE.match(buf, end).end()
+            following = buf[following_at:following_at + 1]
+            complete = following in (',', ']') or eof
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+        if not complete:
+            chunk = text.read(READ_BUFFER_SIZE)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+            continue
+        
+        yield item
+        pos = end
+        
+        delimiter = next_char()
+        if delimiter == ']':
+            return
+        if delimiter != ',':
+            raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+        pos += 1
+
+
+def iter_documents(json_file: str) -> Iterator[Any]:
+    """
+    Yield the documents in a JSON array file one at a time.
+    
+    Streams the file, so memory use is bounded by one document rather than the
+    whole file. Uses ijson when it's installed, otherwise the standard library
+    json decoder.
+    
+    Raises:
+        ValueError: If the file doesn't contain a top-level array, or is
+            malformed (whichever parser is used)
+    """
+    with open(json_file, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        # The file is read front to back, so let the kernel read ahead
+        # aggressively where it supports the hint
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        # Check the top level is an array before parsing anything
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        if first != b'[':
+            raise ValueError("JSON file must contain a list of documents")
+        f.seek(0)
+        
+        try:
+            import ijson
+        except ImportError:
+            yield from _iter_array_items(f)
+            return
+        
+        # use_float keeps numbers as floats (Firestore can't store Decimal).
+        # ijson's errors aren't ValueErrors, unlike json's, so convert them
+        try:
+            yield from ijson.items(f, 'item', use_float=True, buf_size=READ_BUFFER_SIZE)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON: {e}") from e
+
+
+def fetch_existing_ids(job_storage) -> Set[str]:
+    """
+    Get the IDs of every document already in the collection.
+    
+    Uses an empty projection, so only document names are streamed back rather
+    than document contents.
+    
+    Args:
+        job_storage: Firestore job storage instance
+    
+    Returns:
+        Set of the IDs that already exist in the collection
+    """
+    return {snapshot.id for snapshot in job_storage.collection.select([]).stream()}
+
+
+def split_into_batches(docs: List[Tuple[str, Dict[str, Any]]]) -> Iterator[List[Tuple[str, Dict[str, Any]]]]:
+    """Split documents into write batches of at most BATCH_SIZE."""
+    for start in range(0, len(docs), BATCH_SIZE):
+        yield docs[start:start + BATCH_SIZE]
+
+
+def _commit_retry():
+    """Retry policy for batch commits: back off and retry on transient errors."""
+    from google.api_core import exceptions, retry
+    return retry.Retry(
+        predicate=retry.if_exception_type(
+            exceptions.Aborted,
+            exceptions.DeadlineExceeded,
+            exceptions.InternalServerError,
+            exceptions.ResourceExhausted,
+            exceptions.ServiceUnavailable
+        ),
+        deadline=120
+    )
+
+
+def commit_batch(job_storage, docs: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """Write a batch of documents with a single commit, retrying transient failures."""
+    # Concurrent commits are spread over the storage's client pool
+    db, collection = job_storage.next_connection()
+    batch = db.batch()
+    for doc_id, doc_data in docs:
+        batch.set(collection.document(doc_id), doc_data, merge=False)
+    batch.commit(retry=_commit_retry())
+
 
 def import_json_to_firestore(job_storage, json_file: str, dry_run: bool = False, 
-                            conflict_action: str = "skip") -> Dict[str, int]:
+                            conflict_action: str = "skip",
+                            workers: int = COMMIT_WORKERS) -> Dict[str, int]:
     """
     Import documents from JSON file to Firestore.
     
@@ -44,80 +219,185 @@ def import_json_to_firestore(job_storage, json_file: str, dry_run: bool = False,
         json_file: Path to JSON file to import
         dry_run: If True, don't actually import, just show what would be imported
         conflict_action: How to handle conflicts ("skip", "overwrite", "error")
+        workers: Number of batch commits to run concurrently
+    
+    Documents are checked as they are read, and batches are committed while
+    the rest of the file is still being read. If the file turns out to be
+    malformed partway through, reading stops there but batches already
+    committed stay written: "incomplete" is set to 1 and the collection
+    holds a partial import. Validate the file first (validate_json_file)
+    to rule that out.
     
     Returns:
         Dictionary with import statistics
     """
+    stats = {
+        "total": 0,
+        "imported": 0,
+        "skipped": 0,
+        "errors": 0,
+        "overwritten": 0,
+        "incomplete": 0
+    }
+    
     try:
-        # Read JSON file
-        with open(json_file, 'r', encoding='utf-8') as f:
-            documents = json.load(f)
-        
-        logger.info(f"Loaded {len(documents)} documents from {json_file}")
-        
-        stats = {
-            "total": len(documents),
-            "imported": 0,
-            "skipped": 0,
-            "errors": 0,
-            "overwritten": 0
-        }
+        logger.info(f"Reading documents from {json_file}")
         
         if dry_run:
             logger.info("DRY RUN MODE - No changes will be made")
         
-        # Process each document
-        for i, doc_data in enumerate(documents, 1):
-            doc_id = doc_data.get("id")
-            if not doc_id:
-                logger.warning(f"Document {i} has no ID, skipping")
-                stats["errors"] += 1
-                continue
-            
+        # Check for conflicts against one scan of the collection's IDs. A real
+        # overwrite import writes every document regardless, so it skips the
+        # scan (and doesn't count which documents it overwrote)
+        if conflict_action == "overwrite" and not dry_run:
+            existing_ids = set()
+            logger.info("Overwriting any existing documents without checking for them")
+        else:
+            existing_ids = fetch_existing_ids(job_storage)
+            logger.info(f"Found {len(existing_ids)} existing documents")
+        
+        stats_lock = threading.Lock()
+        
+        # Per-document messages are debug-level; check once so their strings
+        # aren't built for every document when they won't be shown
+        log_each = logger.isEnabledFor(logging.DEBUG)
+        
+        def import_batch(batch: List[Tuple[str, Dict[str, Any]]]) -> None:
             try:
-                # Check if document already exists
-                existing_doc = job_storage.get_job(doc_id)
+                commit_batch(job_storage, batch)
+                with stats_lock:
+                    before = stats["imported"]
+                    stats["imported"] += len(batch)
+                    if stats["imported"] // PROGRESS_INTERVAL > before // PROGRESS_INTERVAL:
+                        logger.info(f"Imported {stats['imported']} documents...")
+            except Exception as e:
+                logger.error(f"Failed to import batch of {len(batch)} documents starting at {batch[0][0]}: {e}")
+                with stats_lock:
+                    stats["errors"] += len(batch)
+        
+        def add_counts(counts: Dict[str, int]) -> None:
+            """Add the main thread's counts for a chunk to the shared stats."""
+            with stats_lock:
+                for key, count in counts.items():
+                    stats[key] += count
+        
+        workers = max(1, workers)
+        read_error = None
+        # Documents read so far (only the main thread reads the file)
+        total = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            queued_ids = set()
+            documents = iter_documents(json_file)
+            
+            # Read, check and queue the file a chunk at a time so only a few
+            # chunks of documents are ever held in memory
+            while read_error is None:
+                chunk = []
+                try:
+                    for doc_data in documents:
+                        chunk.append(doc_data)
+                        if len(chunk) == READ_CHUNK_SIZE:
+                            break
+                except ValueError as e:
+                    # Malformed JSON. The documents read before the error are
+                    # still queued below, then reading stops; batches already
+                    # queued still finish
+                    read_error = e
+                if not chunk:
+                    break
                 
-                if existing_doc:
-                    if conflict_action == "skip":
-                        logger.info(f"Document {doc_id} already exists, skipping")
-                        stats["skipped"] += 1
+                # The chunk is counted locally, then added to the stats under
+                # the lock the commit threads update them with
+                counts = {"total": len(chunk), "errors": 0, "skipped": 0, "overwritten": 0, "imported": 0}
+                
+                # Validate as we go rather than reading the file twice, and
+                # collect the documents that have IDs
+                docs = []
+                for doc_data in chunk:
+                    total += 1
+                    if not isinstance(doc_data, dict):
+                        logger.warning(f"Document {total} is not a dictionary, skipping")
+                        counts["errors"] += 1
+                        continue
+                    doc_id = doc_data.get("id")
+                    if not doc_id:
+                        logger.warning(f"Document {total} has no ID, skipping")
+                        counts["errors"] += 1
                         continue
-                    elif conflict_action == "error":
-                        logger.error(f"Document {doc_id} already exists, aborting")
-                        stats["errors"] += 1
-                        if not dry_run:
-                            return stats
-                    elif conflict_action == "overwrite":
-                        logger.info(f"Document {doc_id} already exists, overwriting")
-                        stats["overwritten"] += 1
+                    docs.append((doc_id, doc_data))
                 
-                if not dry_run:
-                    # Import the document
-                    doc_ref = job_storage.collection.document(doc_id)
-                    doc_ref.set(doc_data, merge=False)
-                    logger.info(f"Imported document {doc_id}")
+                # Resolve conflicts. Keyed by ID so a document repeated in the
+                # chunk is written once (last copy wins)
+                to_write = {}
+                for doc_id, doc_data in docs:
+                    if doc_id in existing_ids:
+                        if conflict_action == "skip":
+                            if log_each:
+                                logger.debug(f"Document {doc_id} already exists, skipping")
+                            counts["skipped"] += 1
+                            continue
+                        elif conflict_action == "error":
+                            logger.error(f"Document {doc_id} already exists, aborting")
+                            counts["errors"] += 1
+                            if not dry_run:
+                                add_counts(counts)
+                                wait(pending)
+                                return stats
+                        elif conflict_action == "overwrite":
+                            if log_each:
+                                logger.debug(f"Document {doc_id} already exists, overwriting")
+                            counts["overwritten"] += 1
+                    to_write[doc_id] = doc_data
                 
-                stats["imported"] += 1
+                # A dry run counts documents as imported without writing them
+                if dry_run:
+                    counts["imported"] = len(to_write)
+                add_counts(counts)
+                if dry_run:
+                    continue
                 
-                if i % 10 == 0:
-                    logger.info(f"Processed {i}/{len(documents)} documents...")
+                # Batches commit concurrently, so let earlier writes of a
+                # repeated document finish first to keep the last copy
+                if not queued_ids.isdisjoint(to_write):
+                    wait(pending)
+                    pending.clear()
+                queued_ids.update(to_write)
                 
-            except Exception as e:
-                logger.error(f"Failed to import document {doc_id}: {e}")
-                stats["errors"] += 1
+                for batch in split_into_batches(list(to_write.items())):
+                    pending.add(executor.submit(import_batch, batch))
+                
+                # Don't read further ahead than the writers can keep up with
+                while len(pending) > workers * 2:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        
+        if read_error is not None:
+            stats["errors"] += 1
+            stats["incomplete"] = 1
+            logger.error(
+                f"Stopped reading {json_file} after document {stats['total']}: {read_error}. "
+                f"{stats['imported']} documents were {'checked' if dry_run else 'committed'} before the error "
+                f"and nothing after document {stats['total']} was imported"
+                + ("" if dry_run else "; the collection now holds a partial import")
+            )
+        elif stats["total"] == 0:
+            logger.warning("JSON file contains no documents")
         
         return stats
         
     except Exception as e:
         logger.error(f"Failed to import from {json_file}: {e}")
-        return {"total": 0, "imported": 0, "skipped": 0, "errors": 1, "overwritten": 0}
+        stats["errors"] += 1
+        return stats
 
 
 def validate_json_file(json_file: str) -> bool:
     """
     Validate that a JSON file is properly formatted and contains documents.
     
+    Used for --validate-only and --validate-first; imports otherwise check
+    each document as they read it.
+    
     Args:
         json_file: Path to JSON file to validate
     
@@ -125,19 +405,9 @@ def validate_json_file(json_file: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            documents = json.load(f)
-        
-        if not isinstance(documents, list):
-            logger.error(f"JSON file must contain a list of documents, got {type(documents)}")
-            return False
-        
-        if len(documents) == 0:
-            logger.warning("JSON file contains no documents")
-            return False
-        
-        # Check that documents have required fields
-        for i, doc in enumerate(documents):
+        # Stream through the documents, stopping at the first bad one
+        count = 0
+        for i, doc in enumerate(iter_documents(json_file)):
             if not isinstance(doc, dict):
                 logger.error(f"Document {i} is not a dictionary")
                 return False
@@ -145,13 +415,22 @@ def validate_json_file(json_file: str) -> bool:
             if "id" not in doc:
                 logger.error(f"Document {i} is missing 'id' field")
                 return False
+            count += 1
+        
+        if count == 0:
+            logger.warning("JSON file contains no documents")
+            return False
         
-        logger.info(f"JSON file validation passed: {len(documents)} documents")
+        logger.info(f"JSON file validation passed: {count} documents")
         return True
         
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON file: {e}")
         return False
+    except ValueError as e:
+        # Raised by iter_documents for a non-array file
+        logger.error(str(e))
+        return False
     except Exception as e:
         logger.error(f"Failed to validate JSON file: {e}")
         return False
@@ -168,6 +447,11 @@ def main():
     parser.add_argument("--project-id", help="Firestore project ID (defaults to FIRESTORE_PROJECT_ID env var)")
     parser.add_argument("--collection", default="jobs", help="Firestore collection name (default: jobs)")
     parser.add_argument("--validate-only", action="store_true", help="Only validate JSON file, don't import")
+    parser.add_argument("--validate-first", action="store_true",
+                       help="Validate the whole file before importing, so a malformed file writes nothing "
+                            "(reads the file twice)")
+    parser.add_argument("--workers", type=int, default=COMMIT_WORKERS,
+                       help=f"Number of concurrent batch commits (default: {COMMIT_WORKERS})")
     
     args = parser.parse_args()
     
@@ -176,14 +460,16 @@ def main():
         logger.error(f"JSON file not found: {args.json_file}")
         sys.exit(1)
     
-    # Validate JSON file
-    if not validate_json_file(args.json_file):
-        logger.error("JSON file validation failed")
-        sys.exit(1)
-    
-    if args.validate_only:
-        logger.info("Validation-only mode: JSON file is valid")
-        return
+    # Documents are validated while importing, so only validate separately
+    # when asked to. Without it, a file malformed partway through is imported
+    # up to the error
+    if args.validate_only or args.validate_first:
+        if not validate_json_file(args.json_file):
+            logger.error("JSON file validation failed")
+            sys.exit(1)
+        if args.validate_only:
+            logger.info("Validation-only mode: JSON file is valid")
+            return
     
     # Initialize job storage
     storage_type = os.getenv("JOB_STORAGE", "firestore")
@@ -210,7 +496,8 @@ def main():
             job_storage,
             args.json_file,
             dry_run=args.dry_run,
-            conflict_action=args.conflict
+            conflict_action=args.conflict,
+            workers=args.workers
         )
         
         # Print summary
@@ -225,6 +512,9 @@ def main():
         
         if args.dry_run:
             logger.info("DRY RUN COMPLETED - No changes were made")
+        elif stats["incomplete"]:
+            logger.error("Import stopped early - the file is malformed and only part of it was imported")
+            sys.exit(1)
         else:
             logger.info("Import completed!")
         
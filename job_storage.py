@@ -3,14 +3,256 @@ Job storage system for Digital Twin API
 Supports in-memory (development), Redis (production), and Firestore (persistent) storage
 """
 
+import os
+import copy
+import functools
 import json
-import uuid
-from typing import Dict, Any, Optional, List
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Iterator, Tuple, Union
 import logging
 from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional, much faster drop-in for (de)serializing job data
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstandard, when installed, compresses large job field values in Redis
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Redis field values at least this large (as JSON) are stored compressed,
+# prefixed with a magic that no JSON value can start with
+COMPRESS_MIN_SIZE = 4096
+COMPRESS_LEVEL = 3
+COMPRESSED_MAGIC = b"ZST1"
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize job data to UTF-8 encoded JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse job data from JSON, as a string or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _encode_value(value: Any) -> bytes:
+    """Serialize a field value for Redis, compressing it if large."""
+    data = _dumps(value)
+    if zstandard is not None and len(data) >= COMPRESS_MIN_SIZE:
+        return COMPRESSED_MAGIC + zstandard.compress(data, COMPRESS_LEVEL)
+    return data
+
+
+def _decode_value(data: bytes) -> Any:
+    """Parse a field value read from Redis, compressed or not."""
+    if data[:4] == COMPRESSED_MAGIC:
+        if zstandard is None:
+            raise ImportError("Job data is zstd-compressed. Run: pip install zstandard")
+        data = zstandard.decompress(data[4:])
+    return _loads(data)
+
+
+# Job statuses that mean the job has finished
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+
+# The formatted date and time up to the second, reused until the second changes
+_iso_second = (0, "1970-01-01T00:00:00")
+
+
+def _iso_from_ns(time_ns: int) -> str:
+    """Format a Unix time in nanoseconds as fixed-width UTC ISO, e.g. 2024-01-01T12:00:00.123456+00:00"""
+    global _iso_second
+    seconds, nanos = divmod(time_ns, 1_000_000_000)
+    cached_seconds, prefix = _iso_second
+    if seconds != cached_seconds:
+        prefix = datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_second = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
+
+
+def _now_iso() -> str:
+    """Current UTC time in one fixed-width ISO format, so timestamps compare correctly as strings"""
+    return _iso_from_ns(time.time_ns())
+
+
+def new_job_id() -> str:
+    """
+    Generate a time-ordered job ID (UUIDv7, RFC 9562) without building a UUID object
+    
+    The leading 48 bits are the creation time in milliseconds, so jobs created
+    together sit together in ID order; the remaining 74 bits are random.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Set the version (7) and variant (0b10) bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+def _get_created_at(job_data: Dict[str, Any]) -> datetime:
+    """Get a job's creation time as a timezone-aware datetime."""
+    created_at_str = job_data.get("created_at", "1970-01-01T00:00:00+00:00")
+    if created_at_str.endswith('Z'):
+        created_at_str = created_at_str[:-1]
+    created_at = datetime.fromisoformat(created_at_str)
+    # Treat timezone-naive timestamps as UTC
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at
+
+def _get_created_ts(job_data: Dict[str, Any]) -> float:
+    """Get a job's creation time as a Unix timestamp, parsed from created_at"""
+    return _get_created_at(job_data).timestamp()
+
+def _init_new_job(job_data: Dict[str, Any]) -> Tuple[str, float]:
+    """
+    Give a new job its ID, creation time and pending status
+    
+    Returns the ID and the creation time as a Unix timestamp, for the
+    storage's own creation index; the job itself only holds created_at.
+    """
+    job_id = new_job_id()
+    now_ns = time.time_ns()
+    job_data.update({
+        "id": job_id,
+        "created_at": _iso_from_ns(now_ns),
+        "status": "pending"
+    })
+    return job_id, now_ns / 1e9
+
+def _get_field(job_data: Dict[str, Any], field_path: str) -> Any:
+    """Look up a dotted field path (e.g. "results.video_url") in job data"""
+    value = job_data
+    for part in field_path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+def _set_fields(job_data: Dict[str, Any], field_updates: Dict[str, Any]) -> None:
+    """Apply dotted field path updates (e.g. {"results.hot_take": ...}) in place"""
+    for field_path, value in field_updates.items():
+        *parents, leaf = field_path.split(".")
+        target = job_data
+        for part in parents:
+            if not isinstance(target.get(part), dict):
+                target[part] = {}
+            target = target[part]
+        target[leaf] = value
+
+def _project_fields(job_data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Return only the given top-level fields of a job that are present"""
+    return {field: job_data[field] for field in fields if field in job_data}
+
+
+# Connections per shared Redis pool; callers beyond this wait for a free one
+REDIS_MAX_CONNECTIONS = 64
+REDIS_POOL_TIMEOUT = 20
+# Idle connections are pinged before reuse after this many seconds
+REDIS_HEALTH_CHECK_INTERVAL = 30
+
+
+@functools.lru_cache(maxsize=None)
+def _redis_client(redis_url: str, decode_responses: bool):
+    """Shared Redis client (and connection pool) per URL and decoding mode"""
+    import redis
+    pool = redis.BlockingConnectionPool.from_url(
+        redis_url,
+        decode_responses=decode_responses,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+@functools.lru_cache(maxsize=None)
+def _firestore_clients(project_id: Optional[str], pool_size: int) -> tuple:
+    """Shared pool of Firestore clients (each with its own gRPC channel) per project"""
+    import base64
+    from google.cloud import firestore
+    from google.oauth2 import service_account
+    
+    # Check for base64-encoded credentials from Fly.io secrets
+    credentials_json_b64 = os.getenv('GOOGLE_APPLICATION_CREDENTIALS_JSON')
+    
+    if credentials_json_b64:
+        # Decode base64 credentials
+        credentials_json = base64.b64decode(credentials_json_b64).decode('utf-8')
+        credentials_info = json.loads(credentials_json)
+        
+        # Create credentials from service account info
+        credentials = service_account.Credentials.from_service_account_info(credentials_info)
+        
+        logger.info("Using base64-encoded Google credentials from Fly.io secrets")
+    else:
+        # Fallback to default credentials (for local development)
+        credentials = None
+        logger.info("Using default Google credentials")
+    
+    # Service account credentials, when given, are shared by every client
+    return tuple(
+        firestore.Client(project=project_id, credentials=credentials)
+        for _ in range(max(1, pool_size))
+    )
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a fixed number of seconds."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        """Get a cached value, or None if it's missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+    
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def pop(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+# How long get_job may serve a job without asking the backend, and how many
+# jobs to keep. Writes through the same storage instance invalidate
+# immediately; writes from other processes show up within the TTL.
+GET_CACHE_TTL = 0.5
+GET_CACHE_SIZE = 1024
+
 class JobStorage:
     """Abstract job storage interface"""
     
@@ -18,6 +260,10 @@ class JobStorage:
         """Create a new job and return its ID"""
         raise NotImplementedError
     
+    def create_jobs(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        """Create several jobs and return their IDs, in order"""
+        return [self.create_job(job_data) for job_data in jobs]
+    
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job by ID"""
         raise NotImplementedError
@@ -26,148 +272,517 @@ class JobStorage:
         """Update job data"""
         raise NotImplementedError
     
+    def update_job_fields(self, job_id: str, field_updates: Dict[str, Any]) -> bool:
+        """Update individual (possibly nested, dotted-path) fields without rewriting their parents"""
+        raise NotImplementedError
+    
     def delete_job(self, job_id: str) -> bool:
         """Delete a job"""
         raise NotImplementedError
     
+    def delete_jobs(self, job_ids: List[str]) -> int:
+        """Delete several jobs, returning how many existed"""
+        return sum(self.delete_job(job_id) for job_id in job_ids)
+    
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """Clean up old completed/failed jobs"""
         raise NotImplementedError
     
-    def list_jobs(self, status: str = None, limit: int = 100) -> List[Dict[str, Any]]:
-        """List jobs with optional status filter"""
+    def list_jobs(self, status: str = None, limit: int = 100, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """List jobs with optional status filter, returning only `fields` when given"""
+        raise NotImplementedError
+    
+    def healthcheck(self) -> None:
+        """Check the backing store is reachable, raising if it isn't"""
+        raise NotImplementedError
+    
+    def iter_jobs_missing_field(self, required_field: str, missing_field: str) -> Iterator[Dict[str, Any]]:
+        """Yield jobs where required_field is set but missing_field is empty (dotted paths)"""
         raise NotImplementedError
 
 class InMemoryJobStorage(JobStorage):
-    """In-memory job storage (for development/single worker)"""
+    """
+    In-memory job storage (for development/single worker)
+    
+    Jobs are split across shards by ID, each with its own lock, so threads
+    working on different jobs don't contend. Within a shard jobs are kept in
+    creation order, with their creation timestamps alongside so cleanup and
+    listing don't parse created_at.
+    """
+    
+    SHARD_COUNT = 16  # Must be a power of two
     
     def __init__(self):
-        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._shards: List[Dict[str, Dict[str, Any]]] = [{} for _ in range(self.SHARD_COUNT)]
+        self._created_ts: List[Dict[str, float]] = [{} for _ in range(self.SHARD_COUNT)]
+        self._locks = [threading.Lock() for _ in range(self.SHARD_COUNT)]
+    
+    def _shard_index(self, job_id: str) -> int:
+        return hash(job_id) & (self.SHARD_COUNT - 1)
     
     def create_job(self, job_data: Dict[str, Any]) -> str:
-        job_id = str(uuid.uuid4())
-        job_data.update({
-            "id": job_id,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "status": "pending"
-        })
-        self.jobs[job_id] = job_data
+        job_id, created_ts = _init_new_job(job_data)
+        index = self._shard_index(job_id)
+        with self._locks[index]:
+            self._shards[index][job_id] = job_data
+            self._created_ts[index][job_id] = created_ts
         logger.info(f"Created job {job_id}")
         return job_id
     
+    def create_jobs(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        # Group by shard so each lock is taken once
+        job_ids = []
+        by_shard: Dict[int, Dict[str, Tuple[Dict[str, Any], float]]] = {}
+        for job_data in jobs:
+            job_id, created_ts = _init_new_job(job_data)
+            job_ids.append(job_id)
+            by_shard.setdefault(self._shard_index(job_id), {})[job_id] = (job_data, created_ts)
+        for index, shard_jobs in by_shard.items():
+            with self._locks[index]:
+                for job_id, (job_data, created_ts) in shard_jobs.items():
+                    self._shards[index][job_id] = job_data
+                    self._created_ts[index][job_id] = created_ts
+        logger.info(f"Created {len(job_ids)} jobs")
+        return job_ids
+    
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        return self.jobs.get(job_id)
+        return self._shards[self._shard_index(job_id)].get(job_id)
     
     def update_job(self, job_id: str, updates: Dict[str, Any]) -> bool:
-        if job_id not in self.jobs:
-            return False
-        
-        self.jobs[job_id].update(updates)
-        self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+        index = self._shard_index(job_id)
+        with self._locks[index]:
+            job_data = self._shards[index].get(job_id)
+            if job_data is None:
+                return False
+            
+            job_data.update(updates)
+            if "created_at" in updates:
+                self._created_ts[index][job_id] = _get_created_ts(updates)
+            job_data["updated_at"] = _now_iso()
         logger.info(f"Updated job {job_id}: {updates}")
         return True
     
+    def update_job_fields(self, job_id: str, field_updates: Dict[str, Any]) -> bool:
+        index = self._shard_index(job_id)
+        with self._locks[index]:
+            job_data = self._shards[index].get(job_id)
+            if job_data is None:
+                return False
+            
+            _set_fields(job_data, field_updates)
+            job_data["updated_at"] = _now_iso()
+        logger.info(f"Updated job {job_id} fields: {list(field_updates)}")
+        return True
+    
     def delete_job(self, job_id: str) -> bool:
-        if job_id in self.jobs:
-            del self.jobs[job_id]
-            logger.info(f"Deleted job {job_id}")
-            return True
-        return False
+        index = self._shard_index(job_id)
+        with self._locks[index]:
+            if self._shards[index].pop(job_id, None) is None:
+                return False
+            self._created_ts[index].pop(job_id, None)
+        logger.info(f"Deleted job {job_id}")
+        return True
     
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+        cutoff_ts = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).timestamp()
         deleted_count = 0
         
-        for job_id, job_data in list(self.jobs.items()):
-            created_at_str = job_data.get("created_at", "1970-01-01T00:00:00+00:00")
-            # Handle both timezone-aware and timezone-naive timestamps
-            try:
-                created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-            except ValueError:
-                # Fallback for timezone-naive timestamps
-                created_at = datetime.fromisoformat(created_at_str).replace(tzinfo=timezone.utc)
-            
-            status = job_data.get("status", "unknown")
-            
-            if created_at < cutoff and status in ["completed", "failed", "cancelled"]:
-                del self.jobs[job_id]
-                deleted_count += 1
+        # One shard at a time, so other shards stay available meanwhile
+        for shard, created_ts, lock in zip(self._shards, self._created_ts, self._locks):
+            with lock:
+                # Collect the IDs first rather than copying every item to delete while iterating
+                to_delete = [
+                    job_id for job_id, job_data in shard.items()
+                    if created_ts[job_id] < cutoff_ts
+                    and job_data.get("status") in TERMINAL_STATUSES
+                ]
+                for job_id in to_delete:
+                    del shard[job_id]
+                    del created_ts[job_id]
+            deleted_count += len(to_delete)
         
         logger.info(f"Cleaned up {deleted_count} old jobs")
         return deleted_count
     
-    def list_jobs(self, status: str = None, limit: int = 100) -> List[Dict[str, Any]]:
-        """List jobs with optional status filter"""
-        jobs = list(self.jobs.values())
+    def _snapshot(self) -> List[List[Tuple[float, Dict[str, Any]]]]:
+        """Copy each shard's (creation timestamp, job) pairs, in creation order."""
+        snapshot = []
+        for shard, created_ts, lock in zip(self._shards, self._created_ts, self._locks):
+            with lock:
+                snapshot.append([(created_ts[job_id], job_data) for job_id, job_data in shard.items()])
+        return snapshot
+    
+    def healthcheck(self) -> None:
+        """Nothing to check for in-process storage"""
+    
+    def list_jobs(self, status: str = None, limit: int = 100, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """List jobs with optional status filter, returning only `fields` when given"""
+        # Merge the shards back into overall creation order
+        jobs = (job for _, job in heapq.merge(*self._snapshot(), key=lambda entry: entry[0]))
         
         # Filter by status if specified
         if status:
-            jobs = [job for job in jobs if job.get("status") == status]
+            jobs = (job for job in jobs if job.get("status") == status)
         
         # Apply limit
-        return jobs[:limit]
+        jobs = itertools.islice(jobs, limit)
+        
+        if fields:
+            return [_project_fields(job, fields) for job in jobs]
+        return list(jobs)
+    
+    def iter_jobs_missing_field(self, required_field: str, missing_field: str) -> Iterator[Dict[str, Any]]:
+        for shard_jobs in self._snapshot():
+            for _, job_data in shard_jobs:
+                if _get_field(job_data, required_field) and not _get_field(job_data, missing_field):
+                    yield job_data
 
 class RedisJobStorage(JobStorage):
-    """Redis-based job storage (for production/multiple workers)"""
+    """
+    Redis-based job storage (for production/multiple workers)
+    
+    Each job is a hash of its top-level fields, with every value JSON-encoded,
+    so updates write only the fields that changed. Jobs written as a single
+    JSON string by older versions are converted to a hash when first touched.
+    """
     
-    def __init__(self, redis_url: str = "redis://redis:6379"):
+    def __init__(self, redis_url: str = "redis://redis:6379", job_ttl_hours: float = 0):
+        # Finished jobs expire this long after finishing (0 keeps them until cleanup)
+        self.job_ttl_seconds = int(job_ttl_hours * 3600)
+        # Short-lived local copies of recently read jobs, for status polling
+        self._get_cache = _TTLCache(GET_CACHE_SIZE, GET_CACHE_TTL)
         try:
             import redis
-            self.redis = redis.from_url(redis_url, decode_responses=True)
-            self.redis.ping()  # Test connection
-            logger.info("Connected to Redis for job storage")
+            # Clients are shared per process, so storages created per worker
+            # or per request reuse one connection pool. Creating one doesn't
+            # connect; see healthcheck()
+            self.redis = _redis_client(redis_url, True)
+            # Job hashes are read without decoding, so their JSON values go
+            # straight from bytes to the parser
+            self._binary = _redis_client(redis_url, False)
+            self._response_error = redis.ResponseError
+            self._watch_error = redis.WatchError
+            self._hset_if_exists = self.redis.register_script(self.HSET_IF_EXISTS_SCRIPT)
+            self._cleanup = self.redis.register_script(self.CLEANUP_SCRIPT)
         except ImportError:
             raise ImportError("Redis not installed. Run: pip install redis")
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.error(f"Failed to set up Redis job storage: {e}")
             raise
     
-    def create_job(self, job_data: Dict[str, Any]) -> str:
-        job_id = str(uuid.uuid4())
-        job_data.update({
-            "id": job_id,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "status": "pending"
-        })
+    def healthcheck(self) -> None:
+        """Check Redis is reachable, raising if it isn't"""
+        self.redis.ping()
+        logger.info("Connected to Redis for job storage")
+    
+    # Sorted sets of job IDs scored by creation time: every job, and just the
+    # finished ones, so cleanup can find expired jobs without reading them
+    CREATED_INDEX = "jobs:by_created"
+    FINISHED_INDEX = "jobs:finished_by_created"
+    
+    # Bumped when a new index needs building from existing jobs
+    INDEX_VERSION_KEY = "jobs:index_version"
+    INDEX_VERSION = 2
+    
+    
+    # Writes fields only if the job exists, so an update is one round trip.
+    # Returns 0 if the job doesn't exist; errors on jobs still stored as strings
+    HSET_IF_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV))
+return 1
+"""
+    
+    # Deletes up to ARGV[2] jobs scored below ARGV[1] in the finished index
+    # (KEYS[1]) along with their created index (KEYS[2]) and active set
+    # (KEYS[3]) entries. Returns {jobs deleted, IDs removed from the index}
+    CLEANUP_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+if #ids == 0 then
+    return {0, ids}
+end
+local deleted = 0
+for _, id in ipairs(ids) do
+    deleted = deleted + redis.call('DEL', 'job:' .. id)
+end
+redis.call('SREM', KEYS[3], unpack(ids))
+redis.call('ZREM', KEYS[2], unpack(ids))
+redis.call('ZREM', KEYS[1], unpack(ids))
+return {deleted, ids}
+"""
+    
+    def _set_expiry(self, pipe, job_id: str, status: Any) -> None:
+        """Queue a TTL on a job that has finished, or clear it on one that hasn't."""
+        if not self.job_ttl_seconds:
+            return
+        if status in TERMINAL_STATUSES:
+            pipe.expire(f"job:{job_id}", self.job_ttl_seconds)
+        else:
+            pipe.persist(f"job:{job_id}")
+    
+    def _created_ts(self, job_id: str, fields: Dict[str, Any]) -> float:
+        """Get a job's creation timestamp from the fields being written, the index or the job."""
+        if "created_at" in fields:
+            return _get_created_ts(fields)
+        created_ts = self.redis.zscore(self.CREATED_INDEX, job_id)
+        if created_ts is not None:
+            return created_ts
+        created_at = self._binary.hget(f"job:{job_id}", "created_at")
+        return _get_created_ts({"created_at": _decode_value(created_at)} if created_at is not None else {})
+    
+    def _track_status(self, pipe, job_id: str, fields: Dict[str, Any], created_ts: Optional[float] = None) -> None:
+        """Queue the index and TTL changes for a job whose status is being written."""
+        status = fields["status"]
+        if status in TERMINAL_STATUSES:
+            if created_ts is None:
+                created_ts = self._created_ts(job_id, fields)
+            pipe.zadd(self.FINISHED_INDEX, {job_id: created_ts})
+        else:
+            pipe.zrem(self.FINISHED_INDEX, job_id)
+        self._set_expiry(pipe, job_id, status)
+    
+    @staticmethod
+    def _encode_fields(fields: Dict[str, Any]) -> Dict[str, bytes]:
+        """JSON-encode (and compress, if large) each field value for storing in a hash."""
+        return {field: _encode_value(value) for field, value in fields.items()}
+    
+    @staticmethod
+    def _decode_fields(fields: Dict[bytes, bytes]) -> Dict[str, Any]:
+        """Decode the JSON-encoded field values read (undecoded) from a hash."""
+        return {field.decode(): _decode_value(value) for field, value in fields.items()}
+    
+    def _convert_legacy_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Convert a job stored as a single JSON string to a hash and return it."""
+        key = f"job:{job_id}"
+        job_data = self._binary.get(key)
+        if not job_data:
+            return None
         
-        # Store job data
-        self.redis.set(
-            f"job:{job_id}",
-            json.dumps(job_data)
-        )
+        job_data = _loads(job_data)
+        pipe = self.redis.pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping=self._encode_fields(job_data))
+        pipe.execute()
+        return job_data
+    
+    def _job_exists(self, job_id: str) -> bool:
+        """Check a job exists, converting it to a hash first if needed."""
+        key_type = self.redis.type(f"job:{job_id}")
+        if key_type == "none":
+            return False
+        if key_type == "string":
+            self._convert_legacy_job(job_id)
+        return True
+    
+    def put_job(self, job_id: str, job_data: Dict[str, Any]) -> None:
+        """Store a complete job under a given ID, replacing any existing one."""
+        key = f"job:{job_id}"
+        self._get_cache.pop(job_id)
+        pipe = self.redis.pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping=self._encode_fields(job_data))
+        pipe.sadd("jobs:active", job_id)
+        created_ts = _get_created_ts(job_data)
+        pipe.zadd(self.CREATED_INDEX, {job_id: created_ts})
+        self._track_status(pipe, job_id, {"status": job_data.get("status")}, created_ts)
+        pipe.execute()
+    
+    def create_job(self, job_data: Dict[str, Any]) -> str:
+        job_id, created_ts = _init_new_job(job_data)
         
-        # Add to job list for cleanup
-        self.redis.sadd("jobs:active", job_id)
+        # Store job data and add to the job list and cleanup index in one round trip
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(f"job:{job_id}", mapping=self._encode_fields(job_data))
+        pipe.sadd("jobs:active", job_id)
+        pipe.zadd(self.CREATED_INDEX, {job_id: created_ts})
+        pipe.execute()
         
         logger.info(f"Created job {job_id} in Redis")
         return job_id
     
+    def create_jobs(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        if not jobs:
+            return []
+        
+        # Every hash, plus one SADD and one ZADD for all of them, in one round trip
+        created_ts = {}
+        pipe = self.redis.pipeline(transaction=False)
+        for job_data in jobs:
+            job_id, created_ts[job_id] = _init_new_job(job_data)
+            pipe.hset(f"job:{job_id}", mapping=self._encode_fields(job_data))
+        pipe.sadd("jobs:active", *created_ts)
+        pipe.zadd(self.CREATED_INDEX, created_ts)
+        pipe.execute()
+        
+        logger.info(f"Created {len(created_ts)} jobs in Redis")
+        return list(created_ts)
+    
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        job_data = self.redis.get(f"job:{job_id}")
-        if job_data:
-            return json.loads(job_data)
-        return None
+        # The raw fields are cached and decoded per call, so callers can't
+        # change the cached copy by changing the dict they get back
+        fields = self._get_cache.get(job_id)
+        if fields is None:
+            try:
+                fields = self._binary.hgetall(f"job:{job_id}")
+            except self._response_error:
+                # Stored as a single JSON string by an older version
+                return self._convert_legacy_job(job_id)
+            if not fields:
+                return None
+            self._get_cache.put(job_id, fields)
+        return self._decode_fields(fields)
     
     def update_job(self, job_id: str, updates: Dict[str, Any]) -> bool:
-        job_data = self.get_job(job_id)
-        if not job_data:
-            return False
+        fields = dict(updates)
+        fields["updated_at"] = _now_iso()
         
-        job_data.update(updates)
-        job_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+        # Only the changed fields are written, checking the job exists in the
+        # same round trip
+        args = [item for field_value in self._encode_fields(fields).items() for item in field_value]
+        try:
+            updated = self._hset_if_exists(keys=[f"job:{job_id}"], args=args)
+        except self._response_error:
+            # Stored as a single JSON string by an older version
+            if not self._job_exists(job_id):
+                return False
+            updated = self._hset_if_exists(keys=[f"job:{job_id}"], args=args)
+        if not updated:
+            return False
         
-        # Update in Redis
-        self.redis.set(
-            f"job:{job_id}",
-            json.dumps(job_data)
-        )
+        pipe = self.redis.pipeline(transaction=False)
+        created_ts = None
+        if "created_at" in fields:
+            created_ts = _get_created_ts(fields)
+            pipe.zadd(self.CREATED_INDEX, {job_id: created_ts})
+            # Rescore in the finished index too, if the job is in it
+            pipe.zadd(self.FINISHED_INDEX, {job_id: created_ts}, xx=True)
+        if "status" in fields:
+            self._track_status(pipe, job_id, fields, created_ts)
+        pipe.execute()
+        self._get_cache.pop(job_id)
         
         logger.info(f"Updated job {job_id} in Redis: {updates}")
         return True
     
+    # Attempts at a nested field update before giving up on a job that keeps changing
+    UPDATE_FIELDS_ATTEMPTS = 10
+    
+    def update_job_fields(self, job_id: str, field_updates: Dict[str, Any]) -> bool:
+        # The nested updates are merged here, so the top-level fields being
+        # changed are read under WATCH and written back in a transaction that
+        # fails, and is retried, if another client changed the job in between
+        key = f"job:{job_id}"
+        top_fields = sorted({field_path.split(".", 1)[0] for field_path in field_updates})
+        for _ in range(self.UPDATE_FIELDS_ATTEMPTS):
+            with self._binary.pipeline() as pipe:
+                try:
+                    pipe.watch(key)
+                    key_type = pipe.type(key)
+                    if key_type == b"none":
+                        return False
+                    if key_type == b"string":
+                        # Stored as a single JSON string by an older version
+                        pipe.unwatch()
+                        self._convert_legacy_job(job_id)
+                        continue
+                    values = pipe.hmget(key, top_fields)
+                    fields = {
+                        field: _decode_value(value)
+                        for field, value in zip(top_fields, values)
+                        if value is not None
+                    }
+                    _set_fields(fields, field_updates)
+                    fields["updated_at"] = _now_iso()
+                    
+                    pipe.multi()
+                    pipe.hset(key, mapping=self._encode_fields(fields))
+                    if "status" in fields:
+                        self._track_status(pipe, job_id, fields)
+                    pipe.execute()
+                except self._watch_error:
+                    continue
+            self._get_cache.pop(job_id)
+            
+            logger.info(f"Updated job {job_id} fields in Redis: {list(field_updates)}")
+            return True
+        raise RuntimeError(f"Job {job_id} kept changing while updating {list(field_updates)}")
+    
+    # Jobs fetched per pipeline when reading many jobs at once
+    MGET_CHUNK_SIZE = 500
+    
+    def _iter_jobs(self, job_ids, chunk_size: int = None, fields: List[str] = None) -> Iterator[tuple]:
+        """Yield (job_id, job_data) for existing jobs, fetching them in pipelined chunks.
+        
+        With `fields`, only those hash fields are fetched (HMGET instead of HGETALL).
+        """
+        job_ids = iter(job_ids)
+        chunk_size = max(1, min(chunk_size or self.MGET_CHUNK_SIZE, self.MGET_CHUNK_SIZE))
+        while True:
+            chunk = list(itertools.islice(job_ids, chunk_size))
+            if not chunk:
+                break
+            pipe = self._binary.pipeline(transaction=False)
+            for job_id in chunk:
+                if fields:
+                    pipe.hmget(f"job:{job_id}", fields)
+                else:
+                    pipe.hgetall(f"job:{job_id}")
+            for job_id, values in zip(chunk, pipe.execute(raise_on_error=False)):
+                if isinstance(values, Exception):
+                    # Stored as a single JSON string by an older version
+                    job_data = self._convert_legacy_job(job_id)
+                    if job_data:
+                        yield job_id, _project_fields(job_data, fields) if fields else job_data
+                    continue
+                if fields:
+                    values = {field.encode(): value for field, value in zip(fields, values) if value is not None}
+                if values:
+                    yield job_id, self._decode_fields(values)
+    
+    def _scan_active_ids(self) -> Iterator[str]:
+        """
+        Stream the active job IDs with SSCAN rather than one SMEMBERS reply.
+        
+        An ID can be repeated if the set is resized mid-scan.
+        """
+        return self.redis.sscan_iter("jobs:active", count=self.MGET_CHUNK_SIZE)
+    
+    def iter_jobs(self, job_ids=None) -> Iterator[tuple]:
+        """Yield (job_id, job_data) for the given jobs (all active jobs by default), fetched in pipelined chunks."""
+        if job_ids is None:
+            job_ids = self._scan_active_ids()
+        return self._iter_jobs(job_ids)
+    
+    def delete_jobs(self, job_ids: List[str]) -> int:
+        """
+        Delete many jobs with one variadic DEL/SREM/ZREM per chunk, all in one round trip.
+        
+        Returns:
+            Number of jobs that existed and were deleted
+        """
+        if not job_ids:
+            return 0
+        pipe = self.redis.pipeline(transaction=False)
+        for start in range(0, len(job_ids), self.MGET_CHUNK_SIZE):
+            chunk = job_ids[start:start + self.MGET_CHUNK_SIZE]
+            pipe.delete(*[f"job:{job_id}" for job_id in chunk])
+            pipe.srem("jobs:active", *chunk)
+            pipe.zrem(self.CREATED_INDEX, *chunk)
+            pipe.zrem(self.FINISHED_INDEX, *chunk)
+        results = pipe.execute()
+        self._get_cache.pop(*job_ids)
+        return sum(results[::4])
+    
     def delete_job(self, job_id: str) -> bool:
-        deleted = self.redis.delete(f"job:{job_id}")
-        self.redis.srem("jobs:active", job_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.delete(f"job:{job_id}")
+        pipe.srem("jobs:active", job_id)
+        pipe.zrem(self.CREATED_INDEX, job_id)
+        pipe.zrem(self.FINISHED_INDEX, job_id)
+        deleted = pipe.execute()[0]
+        self._get_cache.pop(job_id)
         
         if deleted:
             logger.info(f"Deleted job {job_id} from Redis")
@@ -175,105 +790,152 @@ class RedisJobStorage(JobStorage):
         return False
     
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+        cutoff_ts = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).timestamp()
         deleted_count = 0
         
-        # Get all active job IDs
-        job_ids = self.redis.smembers("jobs:active")
+        self._build_indexes()
         
-        for job_id in job_ids:
-            job_data = self.get_job(job_id)
-            if not job_data:
-                continue
-            
-            created_at_str = job_data.get("created_at", "1970-01-01T00:00:00+00:00")
-            # Handle both timezone-aware and timezone-naive timestamps
-            try:
-                created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-            except ValueError:
-                # Fallback for timezone-naive timestamps
-                created_at = datetime.fromisoformat(created_at_str).replace(tzinfo=timezone.utc)
-            
-            status = job_data.get("status", "unknown")
-            
-            if created_at < cutoff and status in ["completed", "failed", "cancelled"]:
-                self.delete_job(job_id)
-                deleted_count += 1
+        # Finished jobs created before the cutoff are found and deleted
+        # server-side, a bounded batch per call so Redis isn't blocked for long.
+        # Jobs that already expired by TTL only leave index entries to remove
+        while True:
+            deleted, expired_ids = self._cleanup(
+                keys=[self.FINISHED_INDEX, self.CREATED_INDEX, "jobs:active"],
+                args=[f"({cutoff_ts}", self.MGET_CHUNK_SIZE]
+            )
+            deleted_count += deleted
+            self._get_cache.pop(*expired_ids)
+            if len(expired_ids) < self.MGET_CHUNK_SIZE:
+                break
         
         logger.info(f"Cleaned up {deleted_count} old jobs from Redis")
         return deleted_count
     
-    def list_jobs(self, status: str = None, limit: int = 100) -> List[Dict[str, Any]]:
-        """List jobs with optional status filter"""
-        jobs = []
+    def _build_indexes(self) -> None:
+        """Add existing jobs that aren't in the indexes yet (all of them after an index version bump)."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(self.INDEX_VERSION_KEY)
+        pipe.zcard(self.CREATED_INDEX)
+        pipe.scard("jobs:active")
+        version, indexed_count, active_count = pipe.execute()
+        up_to_date = int(version or 0) >= self.INDEX_VERSION
+        if up_to_date and indexed_count >= active_count:
+            return
         
-        # Get all active job IDs
         job_ids = self.redis.smembers("jobs:active")
+        if up_to_date:
+            indexed_ids = set(self.redis.zrange(self.CREATED_INDEX, 0, -1))
+            job_ids = [job_id for job_id in job_ids if job_id not in indexed_ids]
         
-        for job_id in job_ids:
-            job_data = self.get_job(job_id)
-            if job_data:
-                # Filter by status if specified
-                if status and job_data.get("status") != status:
-                    continue
-                jobs.append(job_data)
-                
-                # Apply limit
-                if len(jobs) >= limit:
-                    break
+        created_scores = {}
+        finished_scores = {}
+        for job_id, job_data in self._iter_jobs(job_ids):
+            created_scores[job_id] = _get_created_ts(job_data)
+            if job_data.get("status") in TERMINAL_STATUSES:
+                finished_scores[job_id] = created_scores[job_id]
+        
+        pipe = self.redis.pipeline(transaction=False)
+        if created_scores:
+            pipe.zadd(self.CREATED_INDEX, created_scores)
+        if finished_scores:
+            pipe.zadd(self.FINISHED_INDEX, finished_scores)
+        pipe.set(self.INDEX_VERSION_KEY, self.INDEX_VERSION)
+        pipe.execute()
+        logger.info(f"Indexed {len(created_scores)} existing jobs ({len(finished_scores)} finished)")
+    
+    def list_jobs(self, status: str = None, limit: int = 100, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """List jobs with optional status filter, returning only `fields` when given"""
+        jobs = []
+        seen_ids = set()
+        
+        # Stream the active job IDs, stopping once the limit is reached
+        job_ids = self._scan_active_ids()
+        
+        # Without a filter every job counts toward the limit, so don't fetch
+        # more than it per round trip
+        chunk_size = None if status else limit
+        
+        # The status filter needs the status field even if it isn't requested
+        fetch_fields = fields
+        if fields and status and "status" not in fields:
+            fetch_fields = list(fields) + ["status"]
+        
+        for job_id, job_data in self._iter_jobs(job_ids, chunk_size, fetch_fields):
+            # Filter by status if specified
+            if status and job_data.get("status") != status:
+                continue
+            # The scan can repeat an ID
+            if job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+            if fetch_fields is not fields:
+                job_data.pop("status", None)
+            jobs.append(job_data)
+            
+            # Apply limit
+            if len(jobs) >= limit:
+                break
         
         return jobs
+    
+    def iter_jobs_missing_field(self, required_field: str, missing_field: str) -> Iterator[Dict[str, Any]]:
+        for job_id, job_data in self._iter_jobs(self._scan_active_ids()):
+            if _get_field(job_data, required_field) and not _get_field(job_data, missing_field):
+                yield job_data
 
 class FirestoreJobStorage(JobStorage):
-    """Firestore-based job storage (for persistent production storage)"""
+    """
+    Firestore-based job storage (for persistent production storage)
+    
+    Requests are spread round-robin over a small pool of clients, each with its
+    own gRPC channel, so concurrent callers don't queue on one connection's
+    stream limit. `db` and `collection` refer to the first client.
+    """
     
-    def __init__(self, project_id: str = None, collection_name: str = "jobs"):
+    def __init__(self, project_id: str = None, collection_name: str = "jobs", client_pool_size: int = 4):
         try:
-            import os
-            import base64
-            import json
-            import tempfile
-            from google.cloud import firestore
             from google.cloud.firestore import FieldFilter
-            from google.oauth2 import service_account
-            
-            # Check for base64-encoded credentials from Fly.io secrets
-            credentials_json_b64 = os.getenv('GOOGLE_APPLICATION_CREDENTIALS_JSON')
             
-            if credentials_json_b64:
-                # Decode base64 credentials
-                credentials_json = base64.b64decode(credentials_json_b64).decode('utf-8')
-                credentials_info = json.loads(credentials_json)
-                
-                # Create credentials from service account info
-                credentials = service_account.Credentials.from_service_account_info(credentials_info)
-                
-                # Initialize Firestore client with credentials
-                self.db = firestore.Client(project=project_id, credentials=credentials)
-                logger.info("Using base64-encoded Google credentials from Fly.io secrets")
-            else:
-                # Fallback to default credentials (for local development)
-                self.db = firestore.Client(project=project_id)
-                logger.info("Using default Google credentials")
+            # Clients are shared per process, so storages created per worker
+            # or per request reuse the same gRPC channels
+            self._clients = list(_firestore_clients(project_id, client_pool_size))
+            self._collections = [client.collection(collection_name) for client in self._clients]
+            self._next_index = itertools.cycle(range(len(self._clients)))
             
-            self.collection = self.db.collection(collection_name)
+            self.db = self._clients[0]
+            self.collection = self._collections[0]
+            # Short-lived local copies of recently read jobs, for status polling
+            self._get_cache = _TTLCache(GET_CACHE_SIZE, GET_CACHE_TTL)
             self._field_filter = FieldFilter  # Store for use in queries
-            
-            # Test connection
-            self.collection.limit(1).stream()
-            logger.info(f"Connected to Firestore for job storage (collection: {collection_name})")
         except ImportError:
             raise ImportError("Firestore not installed. Run: pip install google-cloud-firestore")
         except Exception as e:
-            logger.error(f"Failed to connect to Firestore: {e}")
+            logger.error(f"Failed to set up Firestore job storage: {e}")
             raise
     
-    def create_job(self, job_data: Dict[str, Any]) -> str:
-        job_id = str(uuid.uuid4())
+    def healthcheck(self) -> None:
+        """Check Firestore is reachable, raising if it isn't"""
+        # stream() is lazy; reading from it is what makes the request
+        for _ in self.collection.limit(1).select([]).stream():
+            break
+        logger.info(f"Connected to Firestore for job storage (collection: {self.collection.id})")
+    
+    def next_connection(self) -> tuple:
+        """Get the next (client, collection) pair from the pool."""
+        index = next(self._next_index)
+        return self._clients[index], self._collections[index]
+    
+    def _next_collection(self):
+        return self.next_connection()[1]
+    
+    @staticmethod
+    def _init_job(job_data: Dict[str, Any]) -> str:
+        """Give a new job its ID, and a creation time and status unless it has them"""
+        job_id = new_job_id()
         
         # Only set created_at if it doesn't already exist
         if "created_at" not in job_data:
-            job_data["created_at"] = datetime.now(timezone.utc).isoformat()
+            job_data["created_at"] = _now_iso()
         
         # Only set status if it doesn't already exist
         if "status" not in job_data:
@@ -282,46 +944,101 @@ class FirestoreJobStorage(JobStorage):
         job_data.update({
             "id": job_id
         })
+        return job_id
+    
+    def create_job(self, job_data: Dict[str, Any]) -> str:
+        job_id = self._init_job(job_data)
         
         # Store job data in Firestore
-        doc_ref = self.collection.document(job_id)
+        doc_ref = self._next_collection().document(job_id)
         doc_ref.set(job_data)
         
         logger.info(f"Created job {job_id} in Firestore")
         return job_id
     
+    def create_jobs(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        job_ids = []
+        max_batch_size = 500  # Firestore batch limit
+        
+        # One batch commit per 500 jobs
+        for start in range(0, len(jobs), max_batch_size):
+            db, collection = self.next_connection()
+            batch = db.batch()
+            for job_data in jobs[start:start + max_batch_size]:
+                job_id = self._init_job(job_data)
+                batch.set(collection.document(job_id), job_data)
+                job_ids.append(job_id)
+            batch.commit()
+        
+        logger.info(f"Created {len(job_ids)} jobs in Firestore")
+        return job_ids
+    
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        doc_ref = self.collection.document(job_id)
+        # Callers get their own copy, so changing it can't change the cache
+        job_data = self._get_cache.get(job_id)
+        if job_data is not None:
+            return copy.deepcopy(job_data)
+        
+        doc_ref = self._next_collection().document(job_id)
         doc = doc_ref.get()
         
         if doc.exists:
-            return doc.to_dict()
+            job_data = doc.to_dict()
+            self._get_cache.put(job_id, copy.deepcopy(job_data))
+            return job_data
         return None
     
     def update_job(self, job_id: str, updates: Dict[str, Any]) -> bool:
-        doc_ref = self.collection.document(job_id)
-        doc = doc_ref.get()
+        from google.api_core.exceptions import NotFound
         
-        if not doc.exists:
+        updates["updated_at"] = _now_iso()
+        
+        # Update in Firestore. update() fails if the document doesn't exist,
+        # so no read is needed first
+        try:
+            self._next_collection().document(job_id).update(updates)
+        except NotFound:
             return False
+        finally:
+            self._get_cache.pop(job_id)
         
-        updates["updated_at"] = datetime.now(timezone.utc).isoformat()
+        logger.info(f"Updated job {job_id} in Firestore: {updates}")
+        return True
+    
+    def update_job_fields(self, job_id: str, field_updates: Dict[str, Any]) -> bool:
+        from google.api_core.exceptions import NotFound
         
-        # Update in Firestore
-        doc_ref.update(updates)
+        updates = dict(field_updates)
+        updates["updated_at"] = _now_iso()
         
-        logger.info(f"Updated job {job_id} in Firestore: {updates}")
+        # Firestore treats dotted keys as field paths, so this is a single
+        # atomic write that fails if the document doesn't exist
+        try:
+            self._next_collection().document(job_id).update(updates)
+        except NotFound:
+            return False
+        finally:
+            self._get_cache.pop(job_id)
+        
+        logger.info(f"Updated job {job_id} fields in Firestore: {list(field_updates)}")
         return True
     
     def delete_job(self, job_id: str) -> bool:
-        doc_ref = self.collection.document(job_id)
-        doc = doc_ref.get()
+        from google.api_core.exceptions import FailedPrecondition, NotFound
         
-        if doc.exists:
-            doc_ref.delete()
-            logger.info(f"Deleted job {job_id} from Firestore")
-            return True
-        return False
+        db, collection = self.next_connection()
+        
+        # The exists precondition makes the delete fail for a missing
+        # document (reported as either error), so no read is needed first
+        try:
+            collection.document(job_id).delete(option=db.write_option(exists=True))
+        except (NotFound, FailedPrecondition):
+            return False
+        finally:
+            self._get_cache.pop(job_id)
+        
+        logger.info(f"Deleted job {job_id} from Firestore")
+        return True
     
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
@@ -329,9 +1046,9 @@ class FirestoreJobStorage(JobStorage):
         
         # Query for old completed/failed jobs
         query = self.collection.where(
-            self._field_filter("status", "in", ["completed", "failed", "cancelled"])
+            self._field_filter("status", "in", sorted(TERMINAL_STATUSES))
         ).where(
-            self._field_filter("created_at", "<", cutoff.isoformat())
+            self._field_filter("created_at", "<", cutoff.isoformat(timespec="microseconds"))
         )
         
         # Delete in batches
@@ -341,6 +1058,7 @@ class FirestoreJobStorage(JobStorage):
         
         for doc in query.stream():
             batch.delete(doc.reference)
+            self._get_cache.pop(doc.id)
             batch_count += 1
             deleted_count += 1
             
@@ -357,8 +1075,8 @@ class FirestoreJobStorage(JobStorage):
         logger.info(f"Cleaned up {deleted_count} old jobs from Firestore")
         return deleted_count
     
-    def list_jobs(self, status: str = None, limit: int = 100) -> List[Dict[str, Any]]:
-        """List jobs with optional status filter"""
+    def list_jobs(self, status: str = None, limit: int = 100, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """List jobs with optional status filter, returning only `fields` when given"""
         query = self.collection
         
         if status:
@@ -367,17 +1085,37 @@ class FirestoreJobStorage(JobStorage):
         query = query.order_by("created_at", direction="DESCENDING")
         query = query.limit(limit)
         
+        # Project server-side so only the requested fields are transferred
+        if fields:
+            query = query.select(fields)
+        
         jobs = []
         for doc in query.stream():
             jobs.append(doc.to_dict())
         
         return jobs
+    
+    def iter_jobs_missing_field(self, required_field: str, missing_field: str) -> Iterator[Dict[str, Any]]:
+        # Firestore can filter on a field being set, but documents without a
+        # field aren't indexed, so the missing check has to happen client-side
+        query = self.collection.where(self._field_filter(required_field, "!=", None))
+        
+        for doc in query.stream():
+            job_data = doc.to_dict()
+            if _get_field(job_data, required_field) and not _get_field(job_data, missing_field):
+                yield job_data
 
 # Factory function to create appropriate storage
 def create_job_storage(storage_type: str = "memory", redis_url: str = "redis://redis:6379", 
                       firestore_project_id: str = None, firestore_collection: str = "jobs",
-                      workers: int = 1) -> JobStorage:
-    """Create job storage based on configuration"""
+                      workers: int = 1, redis_job_ttl_hours: float = 0,
+                      health_check: bool = False) -> JobStorage:
+    """
+    Create job storage based on configuration
+    
+    Creating a storage doesn't contact the service; pass health_check=True
+    (once, at startup) to fail fast if it is unreachable.
+    """
     
     # Safety check: Never allow in-memory storage with multiple workers
     if workers > 1 and storage_type == "memory":
@@ -388,7 +1126,10 @@ def create_job_storage(storage_type: str = "memory", redis_url: str = "redis://r
     
     if storage_type == "firestore":
         try:
-            return FirestoreJobStorage(firestore_project_id, firestore_collection)
+            storage = FirestoreJobStorage(firestore_project_id, firestore_collection)
+            if health_check:
+                storage.healthcheck()
+            return storage
         except Exception as e:
             # Fail if Firestore is not available
             raise RuntimeError(
@@ -398,7 +1139,10 @@ def create_job_storage(storage_type: str = "memory", redis_url: str = "redis://r
             )
     elif storage_type == "redis":
         try:
-            return RedisJobStorage(redis_url)
+            storage = RedisJobStorage(redis_url, redis_job_ttl_hours)
+            if health_check:
+                storage.healthcheck()
+            return storage
         except Exception as e:
             # Fail if Redis is not available
             raise RuntimeError(
@@ -0,0 +1,26 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+
+def start_log_listener() -> None:
+    """
+    Hand the root logger's output to a background thread.
+    
+    The root logger's handlers (as configured by basicConfig or uvicorn) are
+    moved behind a QueueListener, so request paths only enqueue records and
+    never block on console I/O, while formatting, levels and filters stay as
+    configured. Call once at startup, after logging is configured; later
+    calls do nothing.
+    """
+    root = logging.getLogger()
+    if not root.handlers or any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        return
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    # Flush anything still queued on exit
+    atexit.register(listener.stop)
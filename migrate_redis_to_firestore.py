@@ -14,8 +14,11 @@ import sys
 import json
 import logging
 import argparse
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple, Any
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -33,8 +36,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Jobs migrated per batch write (Firestore's limit is 500 writes per batch)
+BATCH_SIZE = 500
 
-def migrate_jobs(redis_storage, firestore_storage, dry_run: bool = False, delete_after: bool = False) -> Dict[str, int]:
+# Batches committed concurrently (writes are network-bound, so threads suffice)
+COMMIT_WORKERS = 8
+
+
+def find_existing_ids(firestore_storage, job_ids: List[str]) -> Set[str]:
+    """Find which jobs already exist in Firestore, with one batched read."""
+    db, collection = firestore_storage.next_connection()
+    refs = [collection.document(job_id) for job_id in job_ids]
+    return {snapshot.id for snapshot in db.get_all(refs) if snapshot.exists}
+
+
+def commit_new_jobs(firestore_storage, jobs: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """
+    Create jobs in Firestore with one batch commit, keeping their IDs.
+    
+    Raises:
+        AlreadyExists: If any of the jobs already exists (nothing is written)
+    """
+    # Concurrent commits are spread over the storage's client pool
+    db, collection = firestore_storage.next_connection()
+    batch = db.batch()
+    for job_id, job_data in jobs:
+        batch.create(collection.document(job_id), job_data)
+    batch.commit()
+
+
+def migrate_jobs(redis_storage, firestore_storage, dry_run: bool = False, delete_after: bool = False,
+                 workers: int = COMMIT_WORKERS) -> Dict[str, int]:
     """
     Migrate jobs from Redis to Firestore.
     
@@ -43,6 +75,7 @@ def migrate_jobs(redis_storage, firestore_storage, dry_run: bool = False, delete
         firestore_storage: Firestore job storage instance
         dry_run: If True, don't actually migrate, just show what would be done
         delete_after: If True, delete jobs from Redis after successful migration
+        workers: Number of batches migrated concurrently
     
     Returns:
         Dictionary with migration statistics
@@ -54,6 +87,62 @@ def migrate_jobs(redis_storage, firestore_storage, dry_run: bool = False, delete
         "failed": 0,
         "deleted": 0
     }
+    stats_lock = threading.Lock()
+    
+    from google.api_core.exceptions import AlreadyExists
+    
+    def migrate_chunk(chunk: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Migrate one batch of jobs, updating the shared stats."""
+        try:
+            if dry_run:
+                # Check which jobs already exist in Firestore
+                existing_ids = find_existing_ids(firestore_storage, [job_id for job_id, _ in chunk])
+                for job_id, _ in chunk:
+                    if job_id in existing_ids:
+                        logger.info(f"Job {job_id} already exists in Firestore, skipping")
+                    else:
+                        logger.info(f"Would migrate job {job_id} to Firestore")
+                with stats_lock:
+                    stats["skipped"] += len(existing_ids)
+                    stats["migrated"] += len(chunk) - len(existing_ids)
+                return
+            
+            for job_id, job_data in chunk:
+                job_data["id"] = job_id  # Ensure the ID is preserved
+            
+            # create() fails if a document already exists, so the usual case
+            # (nothing migrated yet) needs no read. The batch is atomic, so
+            # if any job exists none are written and the chunk is retried
+            # without the existing ones
+            skipped = 0
+            try:
+                commit_new_jobs(firestore_storage, chunk)
+                to_migrate = chunk
+            except AlreadyExists:
+                existing_ids = find_existing_ids(firestore_storage, [job_id for job_id, _ in chunk])
+                for job_id in existing_ids:
+                    logger.info(f"Job {job_id} already exists in Firestore, skipping")
+                skipped = len(existing_ids)
+                to_migrate = [(job_id, job_data) for job_id, job_data in chunk if job_id not in existing_ids]
+                if to_migrate:
+                    commit_new_jobs(firestore_storage, to_migrate)
+            
+            logger.info(f"Migrated {len(to_migrate)} jobs to Firestore")
+            with stats_lock:
+                stats["skipped"] += skipped
+                stats["migrated"] += len(to_migrate)
+        except Exception as e:
+            logger.error(f"Failed to migrate batch of {len(chunk)} jobs starting at {chunk[0][0]}: {e}")
+            with stats_lock:
+                stats["failed"] += len(chunk)
+            return
+        
+        # Delete from Redis if requested
+        if delete_after:
+            deleted = redis_storage.delete_jobs([job_id for job_id, _ in to_migrate])
+            logger.info(f"Deleted {deleted} jobs from Redis")
+            with stats_lock:
+                stats["deleted"] += deleted
     
     try:
         # Get all active job IDs from Redis
@@ -66,47 +155,29 @@ def migrate_jobs(redis_storage, firestore_storage, dry_run: bool = False, delete
         
         logger.info(f"Found {stats['total_jobs']} jobs in Redis to migrate")
         
-        for job_id in job_ids:
-            try:
-                # Get job data from Redis
-                job_data = redis_storage.get_job(job_id)
-                if not job_data:
-                    logger.warning(f"Job {job_id} not found in Redis, skipping")
-                    stats["skipped"] += 1
-                    continue
-                
-                # Check if job already exists in Firestore
-                existing_job = firestore_storage.get_job(job_id)
-                if existing_job:
-                    logger.info(f"Job {job_id} already exists in Firestore, skipping")
-                    stats["skipped"] += 1
-                    continue
+        # Read jobs from Redis in pipelined chunks and migrate them a chunk at
+        # a time, with one batch write per chunk and several chunks in flight
+        jobs = redis_storage.iter_jobs(job_ids)
+        found_count = 0
+        workers = max(1, workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            while True:
+                chunk = list(itertools.islice(jobs, BATCH_SIZE))
+                if not chunk:
+                    break
+                found_count += len(chunk)
+                pending.add(executor.submit(migrate_chunk, chunk))
                 
-                if dry_run:
-                    logger.info(f"Would migrate job {job_id} to Firestore")
-                    stats["migrated"] += 1
-                    continue
-                
-                # Create job in Firestore
-                # Note: We need to handle the ID manually since create_job generates a new one
-                job_data["id"] = job_id  # Ensure the ID is preserved
-                
-                # Use Firestore's document reference to set with specific ID
-                doc_ref = firestore_storage.collection.document(job_id)
-                doc_ref.set(job_data)
-                
-                logger.info(f"Successfully migrated job {job_id} to Firestore")
-                stats["migrated"] += 1
-                
-                # Delete from Redis if requested
-                if delete_after:
-                    redis_storage.delete_job(job_id)
-                    logger.info(f"Deleted job {job_id} from Redis")
-                    stats["deleted"] += 1
-                    
-            except Exception as e:
-                logger.error(f"Failed to migrate job {job_id}: {e}")
-                stats["failed"] += 1
+                # Don't read further ahead than the writers can keep up with
+                while len(pending) > workers * 2:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        
+        # IDs in the active set whose job data is gone
+        missing_count = stats["total_jobs"] - found_count
+        if missing_count:
+            logger.warning(f"{missing_count} jobs not found in Redis, skipped")
+            stats["skipped"] += missing_count
         
         return stats
         
@@ -127,6 +198,8 @@ def main():
                        help='Firestore project ID')
     parser.add_argument('--firestore-collection', default='jobs',
                        help='Firestore collection name')
+    parser.add_argument('--workers', type=int, default=COMMIT_WORKERS,
+                       help=f'Number of batches migrated concurrently (default: {COMMIT_WORKERS})')
     
     args = parser.parse_args()
     
@@ -149,7 +222,8 @@ def main():
             redis_storage, 
             firestore_storage, 
             dry_run=args.dry_run,
-            delete_after=args.delete_after
+            delete_after=args.delete_after,
+            workers=args.workers
         )
         
         # Print summary
@@ -228,32 +228,35 @@ def validate_persona(persona_id: str):
             print(f"  - {warning}")
 
 
-def main():
+# Subcommands: (help, help for the persona_id argument, or None if it takes none)
+COMMANDS = {
+    'list': ('List all personas', None),
+    'show': ('Show detailed information about a persona', 'Persona ID to show'),
+    'add': ('Add a new persona interactively', None),
+    'update': ('Update an existing persona', 'Persona ID to update'),
+    'delete': ('Delete a persona', 'Persona ID to delete'),
+    'validate': ('Validate a persona configuration', 'Persona ID to validate'),
+}
+
+
+def build_parser(argv: list) -> argparse.ArgumentParser:
+    """Build the argument parser, with only the subcommand being run when it is known"""
     parser = argparse.ArgumentParser(description="Persona Management CLI")
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # List personas
-    subparsers.add_parser('list', help='List all personas')
-    
-    # Show persona
-    show_parser = subparsers.add_parser('show', help='Show detailed information about a persona')
-    show_parser.add_argument('persona_id', help='Persona ID to show')
-    
-    # Add persona
-    subparsers.add_parser('add', help='Add a new persona interactively')
-    
-    # Update persona
-    update_parser = subparsers.add_parser('update', help='Update an existing persona')
-    update_parser.add_argument('persona_id', help='Persona ID to update')
-    
-    # Delete persona
-    delete_parser = subparsers.add_parser('delete', help='Delete a persona')
-    delete_parser.add_argument('persona_id', help='Persona ID to delete')
-    
-    # Validate persona
-    validate_parser = subparsers.add_parser('validate', help='Validate a persona configuration')
-    validate_parser.add_argument('persona_id', help='Persona ID to validate')
+    # Top-level help and unknown commands need every subcommand listed
+    names = [argv[0]] if argv and argv[0] in COMMANDS else COMMANDS
+    for name in names:
+        help_text, persona_id_help = COMMANDS[name]
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if persona_id_help:
+            command_parser.add_argument('persona_id', help=persona_id_help)
     
+    return parser
+
+
+def main():
+    parser = build_parser(sys.argv[1:])
     args = parser.parse_args()
     
     if not args.command:
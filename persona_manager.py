@@ -11,15 +11,41 @@ This module manages different personas with their configurations including:
 
 import os
 import json
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Tuple, Iterator
+from dataclasses import dataclass, fields, replace
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional, faster drop-in for reading and writing personas.json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON from UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+# Seconds a persona's validation result is reused before its files are checked again
+VALIDATION_CACHE_TTL = 5.0
+
+
+@dataclass(slots=True)
 class Persona:
     """Represents a persona configuration"""
     name: str
@@ -36,7 +62,9 @@ class Persona:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert persona to dictionary"""
-        return asdict(self)
+        # Every field is a plain string (or None), so a shallow copy is
+        # enough; asdict's recursive deep copy is wasted on them
+        return {f.name: getattr(self, f.name) for f in fields(self)}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Persona':
@@ -44,6 +72,10 @@ class Persona:
         return cls(**data)
 
 
+# Persona attributes that updates may set
+PERSONA_FIELDS = frozenset(f.name for f in fields(Persona))
+
+
 class PersonaManager:
     """Manages multiple personas and their configurations"""
     
@@ -52,18 +84,35 @@ class PersonaManager:
         self.personas_dir.mkdir(exist_ok=True)
         self.config_file = self.personas_dir / "personas.json"
         self.personas: Dict[str, Persona] = {}
+        # Derived views of self.personas, built on first use and dropped
+        # whenever a persona changes
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
+        self._name_index: Optional[Dict[str, str]] = None
+        # Prompt file contents by path, with the (mtime_ns, size) they were read at
+        self._prompt_cache: Dict[str, Tuple[int, int, str]] = {}
+        # Validation results by persona ID, with the configuration they were
+        # computed for and when
+        self._validation_cache: Dict[str, Tuple[Tuple, float, Dict[str, Any]]] = {}
+        # Nesting depth of batch() blocks; changes aren't saved while inside one
+        self._batch_depth = 0
         self.load_personas()
     
+    def _invalidate_caches(self) -> None:
+        """Drop the cached persona list, name index and validation results after a change"""
+        self._list_cache = None
+        self._name_index = None
+        self._validation_cache.clear()
+    
     def load_personas(self) -> None:
         """Load all personas from configuration file"""
+        self._invalidate_caches()
         if not self.config_file.exists():
             logger.info("No personas configuration found. Creating default Chad Goldstein persona.")
             self.create_default_personas()
             return
         
         try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
+            data = _loads(self.config_file.read_bytes())
             
             self.personas = {}
             for persona_id, persona_data in data.items():
@@ -79,12 +128,34 @@ class PersonaManager:
         """Save all personas to configuration file"""
         try:
             data = {persona_id: persona.to_dict() for persona_id, persona in self.personas.items()}
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.config_file.write_bytes(_dumps(data))
             logger.info(f"Saved {len(self.personas)} personas")
         except Exception as e:
             logger.error(f"Error saving personas: {e}")
     
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Save once at the end of a block of changes instead of after each one
+        
+        Example:
+            with persona_manager.batch():
+                for persona_id, persona in new_personas.items():
+                    persona_manager.add_persona(persona_id, persona)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.save_personas()
+    
+    def _save_changes(self) -> None:
+        """Save after a change, unless inside a batch() block"""
+        if self._batch_depth == 0:
+            self.save_personas()
+    
     def create_default_personas(self) -> None:
         """Create default personas including Chad Goldstein"""
         # Chad Goldstein persona
@@ -135,6 +206,7 @@ class PersonaManager:
         self.personas["chad_goldstein"] = chad_persona
         self.personas["sarah_guo"] = sarah_persona
         self.personas["russ_hanneman"] = russ_persona
+        self._invalidate_caches()
         
         # Save the default personas
         self.save_personas()
@@ -142,7 +214,8 @@ class PersonaManager:
     def add_persona(self, persona_id: str, persona: Persona) -> None:
         """Add a new persona"""
         self.personas[persona_id] = persona
-        self.save_personas()
+        self._invalidate_caches()
+        self._save_changes()
         logger.info(f"Added persona: {persona.name} (ID: {persona_id})")
     
     def get_persona(self, persona_id: str) -> Optional[Persona]:
@@ -151,7 +224,12 @@ class PersonaManager:
         return persona
     
     def list_personas(self) -> List[Dict[str, Any]]:
-        """List all available personas"""
+        """List all available personas (the entries are shared; don't modify them)"""
+        if self._list_cache is None:
+            self._list_cache = self._build_persona_list()
+        return list(self._list_cache)
+    
+    def _build_persona_list(self) -> List[Dict[str, Any]]:
         return [
             {
                 "id": persona_id,
@@ -169,18 +247,35 @@ class PersonaManager:
             for persona_id, persona in self.personas.items()
         ]
     
+    def persona_ids_by_name(self) -> Dict[str, str]:
+        """
+        Map each persona's name, as used in file names, to its ID
+        
+        Names are lowercased with spaces replaced by underscores, e.g.
+        "chad_goldstein". The mapping is shared; don't modify it.
+        """
+        if self._name_index is None:
+            self._name_index = {
+                persona.name.lower().replace(' ', '_'): persona_id
+                for persona_id, persona in self.personas.items()
+            }
+        return self._name_index
+    
     def update_persona(self, persona_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing persona"""
         if persona_id not in self.personas:
             logger.error(f"Persona {persona_id} not found")
             return False
         
-        persona = self.personas[persona_id]
-        for key, value in updates.items():
-            if hasattr(persona, key):
-                setattr(persona, key, value)
+        # Keys that aren't persona fields are ignored
+        persona = replace(
+            self.personas[persona_id],
+            **{key: value for key, value in updates.items() if key in PERSONA_FIELDS}
+        )
+        self.personas[persona_id] = persona
+        self._invalidate_caches()
         
-        self.save_personas()
+        self._save_changes()
         logger.info(f"Updated persona: {persona.name} (ID: {persona_id})")
         return True
     
@@ -192,7 +287,8 @@ class PersonaManager:
         
         persona_name = self.personas[persona_id].name
         del self.personas[persona_id]
-        self.save_personas()
+        self._invalidate_caches()
+        self._save_changes()
         logger.info(f"Deleted persona: {persona_name} (ID: {persona_id})")
         return True
     
@@ -202,14 +298,26 @@ class PersonaManager:
         if not persona:
             return None
         
-        prompt_path = Path(persona.prompt_file)
-        if not prompt_path.exists():
+        prompt_path = persona.prompt_file
+        try:
+            st = os.stat(prompt_path)
+        except FileNotFoundError:
             logger.warning(f"Prompt file not found: {prompt_path}")
             return None
+        except OSError as e:
+            logger.error(f"Error reading prompt file {prompt_path}: {e}")
+            return None
+        
+        # Reuse the last read unless the file has changed since
+        cached = self._prompt_cache.get(prompt_path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
         
         try:
             with open(prompt_path, 'r') as f:
-                return f.read().strip()
+                content = f.read().strip()
+            self._prompt_cache[prompt_path] = (st.st_mtime_ns, st.st_size, content)
+            return content
         except Exception as e:
             logger.error(f"Error reading prompt file {prompt_path}: {e}")
             return None
@@ -220,15 +328,26 @@ class PersonaManager:
         if not persona:
             return {"valid": False, "errors": ["Persona not found"]}
         
+        # Reuse a recent result for the same configuration rather than
+        # checking the files again on every request
+        config_key = (
+            persona.prompt_file, persona.image_file, persona.elevenlabs_voice_id,
+            persona.heygen_voice_id, persona.heygen_avatar_id
+        )
+        now = time.monotonic()
+        cached = self._validation_cache.get(persona_id)
+        if cached and cached[0] == config_key and now - cached[1] < VALIDATION_CACHE_TTL:
+            return cached[2]
+        
         errors = []
         warnings = []
         
         # Check prompt file
-        if not Path(persona.prompt_file).exists():
+        if not os.path.isfile(persona.prompt_file):
             errors.append(f"Prompt file not found: {persona.prompt_file}")
         
         # Check image file
-        if persona.image_file and not Path(persona.image_file).exists():
+        if persona.image_file and not os.path.isfile(persona.image_file):
             warnings.append(f"Image file not found: {persona.image_file}")
         
         # Check voice configurations
@@ -239,18 +358,43 @@ class PersonaManager:
         if not persona.heygen_avatar_id:
             warnings.append("No HeyGen avatar ID configured")
         
-        return {
+        result = {
             "valid": len(errors) == 0,
             "errors": errors,
             "warnings": warnings,
             "persona": persona
         }
+        self._validation_cache[persona_id] = (config_key, now, result)
+        return result
     
     def reload_personas(self) -> None:
         """Force reload personas from the configuration file"""
-        print("🔄 Reloading personas from configuration file...")
+        logger.info("Reloading personas from configuration file")
         self.load_personas()
 
 
-# Global persona manager instance
-persona_manager = PersonaManager()
+class _LazyPersonaManager:
+    """
+    Stands in for the global PersonaManager, creating it on first use.
+    
+    Importing the module then doesn't read the personas configuration, so
+    code that never touches the manager (CLI help, argument errors) skips it.
+    """
+    
+    def __init__(self):
+        self._manager: Optional[PersonaManager] = None
+        self._lock = threading.Lock()
+    
+    def _get(self) -> PersonaManager:
+        if self._manager is None:
+            with self._lock:
+                if self._manager is None:
+                    self._manager = PersonaManager()
+        return self._manager
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+
+# Global persona manager instance (created on first use)
+persona_manager = _LazyPersonaManager()
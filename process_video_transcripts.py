@@ -3,27 +3,31 @@
 Process video transcripts for Redis jobs.
 
 This script finds all jobs in Redis that have a video_url but no results.hot_take,
-downloads the video, extracts audio, transcribes it using Whisper, and sets the
-transcript as the hot_take result.
+streams the video through ffmpeg (downloading it if needed) to extract audio,
+transcribes it using Whisper, and sets the transcript as the hot_take result.
 """
 
 import os
+import re
 import sys
 import json
 import logging
 import argparse
+import shutil
 import tempfile
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from urllib.parse import urlparse
+from typing import Dict, Any, Optional, List, Tuple
+from urllib.parse import urlparse, unquote
 from datetime import datetime, timezone
 
 # Add the current directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from job_storage import create_job_storage
-from audio_processor import AudioProcessor
+from audio_processor import AudioProcessor, StreamDecodeError
+from video_probe import PEEK_SIZE, PeekedStream, index_at_end
 from config import Config
 
 # Set up logging
@@ -33,14 +37,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bytes read from the network and written to disk per call when downloading
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
-def download_video(video_url: str, temp_dir: Path) -> str:
+# S3 objects at least this large are downloaded as concurrent ranged parts
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_MAX_CONCURRENCY = 8
+
+# Virtual-hosted S3 URLs, as S3Storage.upload_file returns them:
+# https://{bucket}.s3[.{region}].amazonaws.com/{key}
+S3_HOST_PATTERN = re.compile(r'^(?P<bucket>.+)\.s3(?:[.-][a-z0-9-]+)?\.amazonaws\.com$')
+
+# RAM-backed filesystem used for downloads when it has at least this much
+# free space (Docker gives containers only 64 MiB of /dev/shm by default)
+RAM_TEMP_ROOT = "/dev/shm"
+RAM_TEMP_MIN_FREE = 2 * 1024 * 1024 * 1024
+
+# Jobs processed concurrently (downloads and transcription requests overlap)
+DEFAULT_CONCURRENCY = 4
+
+
+def parse_s3_url(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Get the (bucket, key) of an s3:// or virtual-hosted S3 HTTPS URL.
+    
+    Returns:
+        (bucket, key), or None if the URL isn't an S3 object URL
+    """
+    parsed_url = urlparse(url)
+    key = unquote(parsed_url.path.lstrip('/'))
+    if not key:
+        return None
+    if parsed_url.scheme == 's3':
+        return parsed_url.netloc, key
+    match = S3_HOST_PATTERN.match(parsed_url.hostname or '')
+    if parsed_url.scheme == 'https' and match and not parsed_url.query:
+        return match.group('bucket'), key
+    return None
+
+
+def _derive_filename(video_url: str) -> str:
+    """Get a file name for a downloaded video from its URL, or a random one if it has none."""
+    path = video_url.partition('?')[0].partition('#')[0]
+    if '://' in path:
+        # Drop the scheme and host, which aren't part of the path
+        path = path.partition('://')[2].partition('/')[2]
+    filename = path.rpartition('/')[2]
+    if '.' not in filename:
+        filename = f"video_{os.urandom(8).hex()}.mp4"
+    return filename
+
+
+def download_video(video_url: str, temp_dir: Path, filename_prefix: str = "",
+                   session: Optional[requests.Session] = None, s3_client=None) -> str:
     """
     Download video from URL to temporary file.
     
     Args:
         video_url: URL of the video to download
         temp_dir: Directory to save the video in
+        filename_prefix: Prefix for the saved file name, to keep concurrent downloads apart
+        session: Session to download with, reusing its connections
+        s3_client: boto3 S3 client to fetch S3 URLs with directly
         
     Returns:
         Path to the downloaded video file
@@ -52,20 +110,35 @@ def download_video(video_url: str, temp_dir: Path) -> str:
         logger.info(f"Downloading video from: {video_url}")
         
         # Create a temporary file with appropriate extension
-        parsed_url = urlparse(video_url)
-        filename = os.path.basename(parsed_url.path)
-        if not filename or '.' not in filename:
-            filename = f"video_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
-        
-        video_path = temp_dir / filename
-        
-        # Download the video
-        response = requests.get(video_url, stream=True, timeout=300)
-        response.raise_for_status()
+        video_path = temp_dir / f"{filename_prefix}{_derive_filename(video_url)}"
         
-        with open(video_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        s3_location = parse_s3_url(video_url) if s3_client else None
+        if s3_location:
+            # Fetch from S3 directly with the signed API, in concurrent
+            # ranged parts for large videos
+            from boto3.s3.transfer import TransferConfig
+            bucket, key = s3_location
+            try:
+                s3_client.download_file(
+                    bucket, key, str(video_path),
+                    Config=TransferConfig(
+                        multipart_threshold=S3_MULTIPART_THRESHOLD,
+                        max_concurrency=S3_MAX_CONCURRENCY
+                    )
+                )
+            except Exception as e:
+                # e.g. a public object in a bucket these credentials can't read
+                logger.warning(f"S3 download of s3://{bucket}/{key} failed, trying HTTP: {e}")
+                s3_location = None
+        if not s3_location:
+            # Download the video, copying the response body to disk in large
+            # reads (still undoing any Content-Encoding). The copy is already
+            # chunked, so the file needs no extra buffering
+            with (session or requests).get(video_url, stream=True, timeout=300) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(video_path, 'wb', buffering=0) as f:
+                    shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
         
         logger.info(f"Downloaded video to: {video_path}")
         return str(video_path)
@@ -74,122 +147,225 @@ def download_video(video_url: str, temp_dir: Path) -> str:
         raise Exception(f"Failed to download video from {video_url}: {str(e)}")
 
 
-def process_job_video(job_storage, job_id: str, job_data: Dict[str, Any], 
-                     audio_processor: AudioProcessor, temp_dir: Path) -> bool:
+def _transcribe_body(body, video_url: str, audio_processor: AudioProcessor,
+                     temp_dir: Path, filename_prefix: str) -> str:
+    """
+    Transcribe a video from its response body, piping it into ffmpeg if it can be.
+    
+    An mp4 whose index is at the end of the file can't be decoded from a
+    pipe, which only shows once all of it has been read. So the start of the
+    body is peeked at first, and such videos are saved from the same
+    transfer and transcribed from the file.
+    """
+    head = body.read(PEEK_SIZE)
+    stream = PeekedStream(head, body)
+    if not index_at_end(head):
+        return audio_processor.process_stream(stream)
+    
+    logger.info(f"Video index is at the end of the file, downloading: {video_url}")
+    video_path = temp_dir / f"{filename_prefix}{_derive_filename(video_url)}"
+    try:
+        with open(video_path, 'wb', buffering=0) as f:
+            shutil.copyfileobj(stream, f, DOWNLOAD_CHUNK_SIZE)
+        return audio_processor.process_input(str(video_path))
+    finally:
+        try:
+            os.unlink(video_path)
+        except FileNotFoundError:
+            pass
+
+
+def stream_transcript(video_url: str, audio_processor: AudioProcessor, temp_dir: Path,
+                      filename_prefix: str = "", session: Optional[requests.Session] = None,
+                      s3_client=None) -> Optional[str]:
+    """
+    Transcribe a video by piping it straight from the network into ffmpeg.
+    
+    Nothing is written to disk and decoding overlaps the download, except for
+    videos that can't be decoded from a pipe (see _transcribe_body).
+    
+    Args:
+        video_url: URL of the video to transcribe
+        audio_processor: AudioProcessor instance for transcription
+        temp_dir: Directory to save videos that can't be streamed in
+        filename_prefix: Prefix for a saved video's file name
+        session: Session to stream with, reusing its connections
+        s3_client: boto3 S3 client to stream S3 URLs with directly
+        
+    Returns:
+        Transcript text, or None if ffmpeg couldn't decode the stream, in
+        which case the video should be downloaded and transcribed from a file
+    
+    Raises:
+        Errors fetching the video or transcribing its audio, which a second
+        attempt from a downloaded file wouldn't fix
+    """
+    try:
+        logger.info(f"Streaming video from: {video_url}")
+        
+        s3_location = parse_s3_url(video_url) if s3_client else None
+        if s3_location:
+            bucket, key = s3_location
+            body = s3_client.get_object(Bucket=bucket, Key=key)["Body"]
+            try:
+                return _transcribe_body(body, video_url, audio_processor, temp_dir, filename_prefix)
+            finally:
+                body.close()
+        
+        with (session or requests).get(video_url, stream=True, timeout=300) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return _transcribe_body(response.raw, video_url, audio_processor, temp_dir, filename_prefix)
+        
+    except StreamDecodeError as e:
+        logger.warning(f"Failed to stream video from {video_url}, downloading it instead: {e}")
+        return None
+
+
+def _extract_video_url(results: Dict[str, Any]) -> Optional[str]:
+    """Get a job's video URL from the possible locations in its results."""
+    if results.get("video_url"):
+        return results["video_url"]
+    if results.get("video_s3_url"):
+        return results["video_s3_url"]
+    if results.get("output_video") and results["output_video"].startswith("http"):
+        return results["output_video"]
+    return None
+
+
+def process_job_video(job_storage, job_id: str, job_data: Dict[str, Any], video_url: str,
+                     audio_processor: AudioProcessor, temp_dir: Path,
+                     session: Optional[requests.Session] = None, s3_client=None) -> bool:
     """
     Process a single job's video to extract transcript.
     
+    The job is expected to have been checked already: it has a video URL and
+    no hot_take.
+    
     Args:
         job_storage: Redis job storage instance
         job_id: Job ID
         job_data: Job data from Redis
+        video_url: URL of the job's video
         audio_processor: AudioProcessor instance for transcription
         temp_dir: Temporary directory for downloads
+        session: Session to download the video with
+        s3_client: boto3 S3 client to fetch S3-hosted videos with
         
     Returns:
         True if processing was successful, False otherwise
     """
     try:
-        # Get video URL from various possible locations
-        video_url = None
-        results = job_data.get("results", {})
-        
-        if results.get("video_url"):
-            video_url = results["video_url"]
-        elif results.get("video_s3_url"):
-            video_url = results["video_s3_url"]
-        elif results.get("output_video") and results["output_video"].startswith("http"):
-            video_url = results["output_video"]
-        
-        if not video_url:
-            logger.warning(f"Job {job_id} has no video URL found")
-            return False
-        
-        # Check if hot_take already exists
-        if results.get("hot_take"):
-            logger.info(f"Job {job_id} already has hot_take, skipping")
-            return False
-        
         logger.info(f"Processing video for job {job_id}")
         
-        # Download the video
-        video_path = download_video(video_url, temp_dir)
-        
-        try:
-            # Extract audio and transcribe
-            logger.info(f"Transcribing video for job {job_id}")
-            transcript = audio_processor.process_input(video_path)
+        # Stream the video through ffmpeg, downloading it only if ffmpeg can't decode it.
+        # Saved videos are prefixed with the job ID, as jobs run concurrently
+        # and the extracted audio is named after the video file
+        transcript = stream_transcript(video_url, audio_processor, temp_dir, filename_prefix=f"{job_id}_",
+                                       session=session, s3_client=s3_client)
+        if transcript is None:
+            video_path = download_video(video_url, temp_dir, filename_prefix=f"{job_id}_",
+                                        session=session, s3_client=s3_client)
             
-            # Update the job with the transcript
-            # Create a copy of results without the id field to avoid overwriting job ID
-            results_copy = {k: v for k, v in results.items() if k != 'id'}
-            update_data = {
-                "results": {
-                    **results_copy,
-                    "hot_take": transcript,
-                    "transcript_source": "whisper",
-                    "transcript_timestamp": datetime.now(timezone.utc).isoformat()
-                }
-            }
-            
-            success = job_storage.update_job(job_id, update_data)
-            if success:
-                logger.info(f"Successfully updated job {job_id} with transcript ({len(transcript)} characters)")
-                return True
-            else:
-                logger.error(f"Failed to update job {job_id} with transcript")
-                return False
-                
-        finally:
-            # Clean up downloaded video
             try:
-                os.unlink(video_path)
-                logger.debug(f"Cleaned up video file: {video_path}")
-            except Exception as e:
-                logger.warning(f"Failed to clean up video file {video_path}: {e}")
+                # Extract audio and transcribe
+                logger.info(f"Transcribing video for job {job_id}")
+                transcript = audio_processor.process_input(video_path)
+            finally:
+                # Clean up downloaded video
+                try:
+                    os.unlink(video_path)
+                    logger.debug(f"Cleaned up video file: {video_path}")
+                except Exception as e:
+                    logger.warning(f"Failed to clean up video file {video_path}: {e}")
+        
+        # Set just the transcript fields within results, leaving the
+        # rest of it as stored rather than rewriting it
+        field_updates = {
+            "results.hot_take": transcript,
+            "results.transcript_source": "whisper",
+            "results.transcript_timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        
+        success = job_storage.update_job_fields(job_id, field_updates)
+        if success:
+            logger.info(f"Successfully updated job {job_id} with transcript ({len(transcript)} characters)")
+            return True
+        else:
+            logger.error(f"Failed to update job {job_id} with transcript")
+            return False
         
     except Exception as e:
         logger.error(f"Error processing video for job {job_id}: {str(e)}")
         return False
 
 
-def find_jobs_needing_transcripts(job_storage) -> List[tuple]:
+def choose_temp_root() -> Optional[str]:
+    """
+    Pick where to download videos: RAM-backed /dev/shm if it has room, so
+    videos aren't written to and read back from disk, else the default.
+    """
+    if sys.platform != "linux" or not os.path.isdir(RAM_TEMP_ROOT):
+        return None
+    try:
+        if shutil.disk_usage(RAM_TEMP_ROOT).free >= RAM_TEMP_MIN_FREE:
+            return RAM_TEMP_ROOT
+    except OSError:
+        pass
+    return None
+
+
+def get_s3_client():
+    """
+    Get an S3 client for downloading S3-hosted videos directly.
+    
+    Returns:
+        The client, or None (videos are then downloaded over HTTP) if S3
+        isn't available
+    """
+    try:
+        from s3_storage import S3Storage
+        return S3Storage().s3_client
+    except Exception as e:
+        logger.warning(f"S3 not available, downloading S3 videos over HTTP: {e}")
+        return None
+
+
+def find_jobs_needing_transcripts(job_storage, limit: Optional[int] = None) -> List[tuple]:
     """
     Find all jobs that have video_url but no results.hot_take.
     
     Args:
         job_storage: Redis job storage instance
+        limit: Stop after finding this many jobs
         
     Returns:
-        List of (job_id, job_data) tuples for jobs needing transcripts
+        List of (job_id, job_data, video_url) tuples for jobs needing transcripts
     """
     jobs_needing_transcripts = []
     
     try:
-        # Get all active job IDs from Redis
-        job_ids = job_storage.redis.smembers("jobs:active")
-        logger.info(f"Found {len(job_ids)} total jobs in Redis")
+        logger.info(f"Found {job_storage.redis.scard('jobs:active')} total jobs in Redis")
         
-        for job_id in job_ids:
-            job_data = job_storage.get_job(job_id)
-            if not job_data:
-                logger.warning(f"Could not retrieve job data for {job_id}")
+        # Scan the active jobs, reading them in pipelined chunks rather than
+        # one round trip each. The scan can repeat an ID
+        seen_ids = set()
+        for job_id, job_data in job_storage.iter_jobs():
+            if job_id in seen_ids:
                 continue
+            seen_ids.add(job_id)
             
-            # Check if job has video URL
+            # Check the job has a video URL but no hot_take
             results = job_data.get("results", {})
-            has_video_url = (
-                results.get("video_url") or 
-                results.get("video_s3_url") or
-                (results.get("output_video") and results["output_video"].startswith("http"))
-            )
-            
-            # Check if job doesn't have hot_take
-            has_hot_take = bool(results.get("hot_take"))
+            if results.get("hot_take"):
+                continue
+            video_url = _extract_video_url(results)
             
-            if has_video_url and not has_hot_take:
-                jobs_needing_transcripts.append((job_id, job_data))
+            if video_url:
+                jobs_needing_transcripts.append((job_id, job_data, video_url))
                 logger.info(f"Job {job_id} needs transcript processing")
+                if limit is not None and len(jobs_needing_transcripts) >= limit:
+                    break
         
         logger.info(f"Found {len(jobs_needing_transcripts)} jobs needing transcript processing")
         return jobs_needing_transcripts
@@ -209,6 +385,11 @@ def main():
                        help="Process only a specific job ID")
     parser.add_argument("--max-jobs", type=int, default=100,
                        help="Maximum number of jobs to process")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                       help=f"Number of jobs processed at once (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--temp-dir", type=str,
+                       help=f"Directory to download videos into (default: {RAM_TEMP_ROOT} if it has room, "
+                            "else the system temp directory)")
     
     args = parser.parse_args()
     
@@ -222,7 +403,7 @@ def main():
         audio_processor = AudioProcessor()
         
         # Create temporary directory
-        temp_dir = Path(tempfile.mkdtemp(prefix="video_transcripts_"))
+        temp_dir = Path(tempfile.mkdtemp(prefix="video_transcripts_", dir=args.temp_dir or choose_temp_root()))
         logger.info(f"Using temporary directory: {temp_dir}")
         
         try:
@@ -234,11 +415,19 @@ def main():
                     logger.error(f"Job {args.job_id} not found")
                     return 1
                 
-                jobs_to_process = [(args.job_id, job_data)]
+                results = job_data.get("results", {})
+                video_url = _extract_video_url(results)
+                if not video_url:
+                    logger.error(f"Job {args.job_id} has no video URL")
+                    return 1
+                if results.get("hot_take"):
+                    logger.info(f"Job {args.job_id} already has hot_take, skipping")
+                    return 0
+                
+                jobs_to_process = [(args.job_id, job_data, video_url)]
             else:
                 # Find all jobs needing transcripts
-                jobs_to_process = find_jobs_needing_transcripts(job_storage)
-                jobs_to_process = jobs_to_process[:args.max_jobs]
+                jobs_to_process = find_jobs_needing_transcripts(job_storage, limit=args.max_jobs)
             
             if not jobs_to_process:
                 logger.info("No jobs found needing transcript processing")
@@ -248,16 +437,32 @@ def main():
             processed_count = 0
             failed_count = 0
             
-            for job_id, job_data in jobs_to_process:
-                if args.dry_run:
+            if args.dry_run:
+                for job_id, _, _ in jobs_to_process:
                     logger.info(f"DRY RUN: Would process job {job_id}")
-                    continue
+            else:
+                # One session for every download, so videos from the same host
+                # reuse connections rather than handshaking again, with a
+                # connection per worker
+                concurrency = max(1, args.concurrency)
+                s3_client = get_s3_client()
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
                 
-                success = process_job_video(job_storage, job_id, job_data, audio_processor, temp_dir)
-                if success:
-                    processed_count += 1
-                else:
-                    failed_count += 1
+                # Each job's download, transcription and update are independent
+                # and mostly waiting on the network, so run several at once
+                with session, ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    results = executor.map(
+                        lambda job: process_job_video(job_storage, *job, audio_processor, temp_dir, session, s3_client),
+                        jobs_to_process
+                    )
+                    for success in results:
+                        if success:
+                            processed_count += 1
+                        else:
+                            failed_count += 1
             
             # Summary
             logger.info("=" * 50)
@@ -273,7 +478,6 @@ def main():
         finally:
             # Clean up temporary directory
             try:
-                import shutil
                 shutil.rmtree(temp_dir)
                 logger.info(f"Cleaned up temporary directory: {temp_dir}")
             except Exception as e:
@@ -29,8 +29,8 @@ def main():
     print("=" * 50)
     
     # Check Python version
-    if sys.version_info < (3, 8):
-        print("❌ Python 3.8 or higher is required")
+    if sys.version_info < (3, 10):
+        print("❌ Python 3.10 or higher is required")
         return 1
     
     print(f"✅ Python {sys.version.split()[0]} detected")
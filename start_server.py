@@ -20,6 +20,8 @@ def start_server():
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
     workers = int(os.getenv("WORKERS", str(workers)))
+    # Worker processes read this to split the OpenAI rate limits between them
+    os.environ["WORKERS"] = str(workers)
     
     print(f"🚀 Starting Digital Twin API Server")
     print(f"📍 Host: {host}")
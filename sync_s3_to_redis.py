@@ -11,10 +11,8 @@ This script:
 
 import os
 import sys
-import json
 import logging
 import re
-import uuid
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 import argparse
@@ -23,8 +21,8 @@ import argparse
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from s3_storage import S3Storage
-from job_storage import create_job_storage
-from persona_manager import PersonaManager
+from job_storage import create_job_storage, new_job_id
+from persona_manager import persona_manager
 from config import Config
 
 # Configure logging
@@ -123,9 +121,7 @@ def parse_video_filename(filename: str) -> Tuple[Optional[str], Optional[datetim
     
     # Pattern 7: job_{persona_name}_{timestamp}
     # First, get all persona names to match against
-    persona_manager = PersonaManager()
-    persona_names = {persona.name.lower().replace(' ', '_'): persona_id 
-                    for persona_id, persona in persona_manager.personas.items()}
+    persona_names = persona_manager.persona_ids_by_name()
     
     for persona_name, persona_id in persona_names.items():
         pattern = rf'^job_{persona_name}_(\d+)$'
@@ -135,14 +131,12 @@ def parse_video_filename(filename: str) -> Tuple[Optional[str], Optional[datetim
             # Convert milliseconds to datetime with UTC timezone
             timestamp = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
             # Generate a proper GUID instead of using timestamp as job_id
-            job_id = str(uuid.uuid4())
+            job_id = new_job_id()
             return job_id, timestamp, persona_id
     
     # Pattern 8: {persona_name}_{job_id}_{timestamp}
     # First, get all persona names to match against
-    persona_manager = PersonaManager()
-    persona_names = {persona.name.lower().replace(' ', '_'): persona_id 
-                    for persona_id, persona in persona_manager.personas.items()}
+    persona_names = persona_manager.persona_ids_by_name()
     
     for persona_name, persona_id in persona_names.items():
         pattern = rf'^{persona_name}_([a-f0-9-]+)_(\d{{4}}-\d{{2}}-\d{{2}}_\d{{2}}-\d{{2}}-\d{{2}})$'
@@ -222,7 +216,6 @@ def create_job_from_s3_video(job_storage, s3_key: str, file_info: Dict,
             persona_id = "chad_goldstein"
         
         job_data["persona_id"] = persona_id
-        persona_manager = PersonaManager()
         persona = persona_manager.get_persona(persona_id)
         if persona:
             job_data["persona_name"] = persona.name
@@ -234,8 +227,7 @@ def create_job_from_s3_video(job_storage, s3_key: str, file_info: Dict,
         # For Redis, we need to handle the active jobs set manually
         if hasattr(job_storage, 'redis') and job_storage.redis:
             # Redis-specific: store directly and add to active set
-            job_storage.redis.set(f"job:{job_id}", json.dumps(job_data))
-            job_storage.redis.sadd("jobs:active", job_id)
+            job_storage.put_job(job_id, job_data)
         else:
             # Firestore: store directly with the specific job_id
             doc_ref = job_storage.collection.document(job_id)
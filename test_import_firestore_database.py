@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for the standard-library JSON array reader used when importing dumps
+"""
+
+import io
+import json
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import import_firestore_database
+from import_firestore_database import _iter_array_items
+
+def read_items(data: str, buffer_size: int) -> list:
+    """Read every item of a JSON array through a read buffer of the given size"""
+    original_size = import_firestore_database.READ_BUFFER_SIZE
+    import_firestore_database.READ_BUFFER_SIZE = buffer_size
+    try:
+        return list(_iter_array_items(io.BytesIO(data.encode("utf-8"))))
+    finally:
+        import_firestore_database.READ_BUFFER_SIZE = original_size
+
+def test_iter_array_items():
+    """Test _iter_array_items against json.loads, across read buffer boundaries"""
+    
+    print("🧪 Testing JSON Array Reader")
+    print("=" * 50)
+    
+    documents = [
+        {"id": "a", "n": 12.5, "big": 123456789012, "neg": -1e-7},
+        {"id": "b", "text": "comma, bracket ] and brace } inside a string", "emoji": "🔥"},
+        {"id": "c", "nested": {"list": [1, 2, [3]], "null": None, "flag": True}},
+        42,
+        "plain string",
+    ]
+    data = json.dumps(documents, ensure_ascii=False, indent=2)
+    
+    # Every buffer size up to a few bytes splits numbers, strings and
+    # delimiters at every possible position
+    print("\n1️⃣ Testing items split across READ_BUFFER_SIZE boundaries:")
+    failed_sizes = [size for size in range(1, 40) if read_items(data, size) != documents]
+    if not failed_sizes:
+        print("✅ Items match json.loads for buffer sizes 1-39")
+    else:
+        print(f"❌ Items differ for buffer sizes {failed_sizes}")
+    
+    # A number cut at the buffer end must not parse as a shorter value
+    print("\n2️⃣ Testing numbers at the end of the buffer:")
+    for data, expected in [("[12.5]", [12.5]), ("[1234, 5]", [1234, 5]), ("[1e10]", [1e10])]:
+        results = {size: read_items(data, size) for size in range(1, len(data) + 1)}
+        if all(items == expected for items in results.values()):
+            print(f"✅ {data} read as {expected} at every buffer size")
+        else:
+            print(f"❌ {data} read wrongly: {results}")
+    
+    print("\n3️⃣ Testing empty arrays:")
+    for data in ["[]", "  [ \n ]  ", "[\t]"]:
+        if read_items(data, 1) == [] and read_items(data, 1024) == []:
+            print(f"✅ {data!r} has no items")
+        else:
+            print(f"❌ {data!r} returned items!")
+    
+    print("\n4️⃣ Testing malformed and truncated input:")
+    for data in ["", "{}", '[{"id": "a"}', '[{"id": "a"},', '[{"id": "a"', '[1 2]', '[{"id": "a"}, ]']:
+        for size in (1, 1024):
+            try:
+                items = read_items(data, size)
+                print(f"❌ {data!r} (buffer {size}) didn't raise, returned {items}")
+            except json.JSONDecodeError:
+                print(f"✅ {data!r} (buffer {size}) raised JSONDecodeError")
+
+if __name__ == "__main__":
+    test_iter_array_items()
@@ -5,7 +5,8 @@ Test script to verify job storage behavior
 
 import os
 import sys
-from job_storage import create_job_storage
+import uuid
+from job_storage import create_job_storage, new_job_id
 
 def test_job_storage():
     """Test job storage with different configurations"""
@@ -73,5 +74,117 @@ def test_job_storage():
     print("- Multiple workers + in-memory: ❌ Blocked")
     print("- Multiple workers + Redis: ✅ Allowed (if Redis available)")
 
+def test_new_job_id():
+    """Test job IDs are valid, time-ordered UUIDv7s"""
+    
+    print("\n🧪 Testing Job IDs")
+    print("=" * 50)
+    
+    job_ids = [new_job_id() for _ in range(1000)]
+    parsed = [uuid.UUID(job_id) for job_id in job_ids]
+    
+    if all(job_id.version == 7 for job_id in parsed):
+        print("✅ Version bits are 7")
+    else:
+        print("❌ Wrong version bits!")
+    
+    if all(job_id.variant == uuid.RFC_4122 for job_id in parsed):
+        print("✅ Variant bits are RFC 4122/9562")
+    else:
+        print("❌ Wrong variant bits!")
+    
+    if all(str(job_id) == text for job_id, text in zip(parsed, job_ids)):
+        print("✅ IDs are in canonical form")
+    else:
+        print("❌ IDs are not in canonical form!")
+    
+    if len(set(job_ids)) == len(job_ids):
+        print("✅ IDs are unique")
+    else:
+        print("❌ Duplicate IDs!")
+    
+    # The leading 48 bits are the creation time in milliseconds
+    timestamps = [job_id.int >> 80 for job_id in parsed]
+    if timestamps == sorted(timestamps):
+        print("✅ IDs are in creation order")
+    else:
+        print("❌ IDs are not in creation order!")
+
+def test_storage_apis():
+    """Test the batch and partial-update storage APIs against in-memory storage"""
+    
+    print("\n🧪 Testing Storage APIs")
+    print("=" * 50)
+    
+    storage = create_job_storage("memory", workers=1)
+    
+    # create_jobs
+    print("\n1️⃣ Testing create_jobs:")
+    jobs = [{"n": n, "results": {"video_url": f"v{n}"}} for n in range(5)]
+    job_ids = storage.create_jobs(jobs)
+    if len(job_ids) == 5 and [storage.get_job(job_id)["n"] for job_id in job_ids] == list(range(5)):
+        print("✅ Jobs created in order")
+    else:
+        print("❌ create_jobs returned the wrong jobs!")
+    
+    if all(storage.get_job(job_id)["status"] == "pending" and "created_at" in storage.get_job(job_id) for job_id in job_ids):
+        print("✅ Jobs have a status and creation time")
+    else:
+        print("❌ Jobs are missing status or created_at!")
+    
+    if storage.create_jobs([]) == []:
+        print("✅ Creating no jobs returns no IDs")
+    else:
+        print("❌ Creating no jobs returned IDs!")
+    
+    # update_job_fields
+    print("\n2️⃣ Testing update_job_fields:")
+    storage.update_job_fields(job_ids[0], {"results.hot_take": "take", "status": "completed"})
+    job = storage.get_job(job_ids[0])
+    if job["results"] == {"video_url": "v0", "hot_take": "take"} and job["status"] == "completed":
+        print("✅ Nested field set without touching its siblings")
+    else:
+        print(f"❌ Unexpected job after update: {job}")
+    
+    storage.update_job_fields(job_ids[1], {"meta.source.name": "test"})
+    if storage.get_job(job_ids[1]).get("meta") == {"source": {"name": "test"}}:
+        print("✅ Missing parents are created")
+    else:
+        print("❌ Missing parents were not created!")
+    
+    if not storage.update_job_fields("missing", {"results.hot_take": "take"}):
+        print("✅ Updating a missing job returns False")
+    else:
+        print("❌ Updating a missing job returned True!")
+    
+    # list_jobs(fields=...)
+    print("\n3️⃣ Testing list_jobs with fields:")
+    listed = storage.list_jobs(fields=["id", "n"])
+    if listed == [{"id": job_id, "n": n} for n, job_id in enumerate(job_ids)]:
+        print("✅ Only the requested fields are returned, in creation order")
+    else:
+        print(f"❌ Unexpected listing: {listed}")
+    
+    listed = storage.list_jobs(status="completed", fields=["id", "missing"])
+    if listed == [{"id": job_ids[0]}]:
+        print("✅ Status filter applies and absent fields are left out")
+    else:
+        print(f"❌ Unexpected filtered listing: {listed}")
+    
+    # delete_jobs
+    print("\n4️⃣ Testing delete_jobs:")
+    deleted = storage.delete_jobs(job_ids[:3] + ["missing"])
+    if deleted == 3 and [job["id"] for job in storage.list_jobs()] == job_ids[3:]:
+        print("✅ Existing jobs deleted and counted")
+    else:
+        print(f"❌ delete_jobs returned {deleted}, leaving {storage.list_jobs()}")
+    
+    if storage.delete_jobs([]) == 0:
+        print("✅ Deleting no jobs deletes nothing")
+    else:
+        print("❌ Deleting no jobs deleted something!")
+
 if __name__ == "__main__":
     test_job_storage()
+    test_new_job_id()
+    test_storage_apis()
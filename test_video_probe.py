@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for telling apart videos that can and can't be streamed into ffmpeg
+"""
+
+import io
+from video_probe import PeekedStream, index_at_end
+
+def box(box_type: bytes, payload: bytes = b"") -> bytes:
+    """Build an MP4 box with a 32-bit size"""
+    return (8 + len(payload)).to_bytes(4, "big") + box_type + payload
+
+def test_index_at_end():
+    """Test index_at_end on the box layouts it has to tell apart"""
+    
+    print("🧪 Testing Video Probe")
+    print("=" * 50)
+    
+    ftyp = box(b"ftyp", b"isom\x00\x00\x02\x00isomiso2mp41")
+    cases = [
+        ("Index before media (faststart)", ftyp + box(b"moov", b"\x00" * 100) + box(b"mdat"), False),
+        ("Media before index", ftyp + box(b"mdat", b"\x00" * 100) + box(b"moov"), True),
+        ("Free box before media", ftyp + box(b"free", b"\x00" * 16) + box(b"mdat"), True),
+        # 64-bit size: size field is 1 and the real size follows the type
+        ("64-bit sized box before media", ftyp + (1).to_bytes(4, "big") + b"wide" + (24).to_bytes(8, "big") + b"\x00" * 8 + box(b"mdat"), True),
+        ("Not an MP4", b"\x1aE\xdf\xa3" + b"\x00" * 60, False),
+        ("Too short to tell", ftyp[:6], False),
+        ("Box running past the peeked bytes", ftyp + box(b"free", b"\x00" * 1000)[:100], False),
+        ("Box sized to the end of the file", ftyp + (0).to_bytes(4, "big") + b"mdat", True),
+        ("Malformed box size", ftyp + (4).to_bytes(4, "big") + b"free", False),
+        ("Empty", b"", False),
+    ]
+    
+    for description, head, expected in cases:
+        result = index_at_end(head)
+        if result == expected:
+            print(f"✅ {description}: {result}")
+        else:
+            print(f"❌ {description}: expected {expected}, got {result}")
+
+def test_peeked_stream():
+    """Test PeekedStream returns the peeked bytes, then the rest of the source"""
+    
+    print("\n🧪 Testing Peeked Stream")
+    print("=" * 50)
+    
+    source = io.BytesIO(b"0123456789")
+    head = source.read(4)
+    stream = PeekedStream(head, source)
+    chunks = [stream.read(3), stream.read(3), stream.read(3), stream.read(3), stream.read(3)]
+    if chunks == [b"012", b"3", b"456", b"789", b""]:
+        print("✅ Sized reads return the peeked bytes first")
+    else:
+        print(f"❌ Unexpected sized reads: {chunks}")
+    
+    source = io.BytesIO(b"0123456789")
+    stream = PeekedStream(source.read(4), source)
+    if stream.read() == b"0123456789" and stream.read() == b"":
+        print("✅ Reading everything returns the whole stream")
+    else:
+        print("❌ Reading everything lost bytes!")
+
+if __name__ == "__main__":
+    test_index_at_end()
+    test_peeked_stream()
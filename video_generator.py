@@ -1,10 +1,13 @@
 import requests
 import time
 import json
+import logging
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 class VideoGenerator:
     def __init__(self):
         self.api_key = Config.HEYGEN_API_KEY
@@ -63,14 +66,12 @@ class VideoGenerator:
         """
         target_talking_photo_id = talking_photo_id or self.talking_photo_id
         
-        # Debug: Print all parameters
-        print(f"🔍 DEBUG - create_video_from_text:")
-        print(f"   talking_photo_id parameter: {talking_photo_id}")
-        print(f"   self.talking_photo_id (default): {self.talking_photo_id}")
-        print(f"   target_talking_photo_id (final): {target_talking_photo_id}")
-        print(f"   persona_name: {persona_name}")
-        print(f"   voice_id: {voice_id}")
-        print(f"   self.default_voice_id: {self.default_voice_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"create_video_from_text: talking_photo_id={talking_photo_id} "
+                f"(default {self.talking_photo_id}, final {target_talking_photo_id}), "
+                f"persona_name={persona_name}, voice_id={voice_id} (default {self.default_voice_id})"
+            )
         
         if not target_talking_photo_id:
             raise ValueError("Talking Photo ID not specified in config or parameters")
@@ -160,13 +161,12 @@ class VideoGenerator:
         """
         target_talking_photo_id = talking_photo_id or self.talking_photo_id
         
-        # Debug: Print all parameters
-        print(f"🔍 DEBUG - create_video_from_audio:")
-        print(f"   talking_photo_id parameter: {talking_photo_id}")
-        print(f"   self.talking_photo_id (default): {self.talking_photo_id}")
-        print(f"   target_talking_photo_id (final): {target_talking_photo_id}")
-        print(f"   persona_name: {persona_name}")
-        print(f"   audio_path: {audio_path}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"create_video_from_audio: talking_photo_id={talking_photo_id} "
+                f"(default {self.talking_photo_id}, final {target_talking_photo_id}), "
+                f"persona_name={persona_name}, audio_path={audio_path}"
+            )
         
         if not target_talking_photo_id:
             raise ValueError("Talking Photo ID not specified in config or parameters")
@@ -0,0 +1,67 @@
+"""
+Helpers for deciding whether a video can be decoded straight from a stream.
+
+An MP4/MOV file keeps its index in a "moov" box. When that box comes after
+the media data ("mdat"), ffmpeg can only find it by reading the whole file,
+and it can't seek back from a pipe, so streaming such a file fails after the
+full transfer. Peeking at the first few boxes tells the two layouts apart
+before anything has been piped.
+"""
+
+from typing import Optional
+
+# Bytes read from the start of a video to find its first top-level boxes
+PEEK_SIZE = 64 * 1024
+
+
+def index_at_end(head: bytes) -> bool:
+    """
+    Check whether a video's first bytes show an MP4/MOV with its index after the media.
+    
+    Args:
+        head: The first bytes of the video (PEEK_SIZE is plenty)
+    
+    Returns:
+        True if the media data box comes before the index box. False if the
+        index comes first, the file isn't an MP4/MOV, or it can't be told
+        from these bytes
+    """
+    pos = 0
+    while pos + 8 <= len(head):
+        size = int.from_bytes(head[pos:pos + 4], "big")
+        box_type = head[pos + 4:pos + 8]
+        if box_type == b"moov":
+            return False
+        if box_type == b"mdat":
+            return True
+        if not box_type.isalnum():
+            # Not an MP4 box, so not an MP4
+            return False
+        if size == 1:
+            # 64-bit size follows the type
+            if pos + 16 > len(head):
+                return False
+            size = int.from_bytes(head[pos + 8:pos + 16], "big")
+        if size < 8:
+            # Box runs to the end of the file (0) or is malformed
+            return False
+        pos += size
+    return False
+
+
+class PeekedStream:
+    """A readable stream that returns already-peeked bytes before the rest of the source."""
+    
+    def __init__(self, head: bytes, source):
+        self._head = head
+        self._source = source
+    
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read up to size bytes (everything left if size is negative)."""
+        if self._head:
+            if size is None or size < 0:
+                data, self._head = self._head + self._source.read(), b""
+                return data
+            data, self._head = self._head[:size], self._head[size:]
+            return data
+        return self._source.read(size)
@@ -19,7 +19,8 @@ from datetime import datetime, timedelta, timezone
 from chad_workflow import ChadWorkflow
 from config import Config
 from persona_manager import persona_manager
-from job_storage import create_job_storage, RedisJobStorage, FirestoreJobStorage
+from job_storage import create_job_storage, new_job_id, RedisJobStorage, FirestoreJobStorage
+from logging_setup import start_log_listener
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -127,6 +128,9 @@ async def startup_event():
     """Initialize the workflow on startup."""
     global workflow, job_storage
     try:
+        # Write log output from a background thread
+        start_log_listener()
+        
         # Force reload personas to ensure fresh data
         persona_manager.reload_personas()
         
@@ -139,15 +143,24 @@ async def startup_event():
         # Get worker count from environment or default to 1
         workers = int(os.getenv("WORKERS", "1"))
         
+        # Let Redis expire finished jobs itself (0 keeps them)
+        redis_job_ttl_hours = float(os.getenv("REDIS_JOB_TTL_HOURS", "0"))
+        
         job_storage = create_job_storage(
             storage_type, 
             redis_url, 
             firestore_project_id,
             firestore_collection,
-            workers
+            workers,
+            redis_job_ttl_hours,
+            health_check=True
         )
         
         workflow = ChadWorkflow()
+        
+        # Warm the async OpenAI connection without delaying startup
+        app.state.openai_warmup = asyncio.create_task(workflow.hot_take_generator.awarmup())
+        
         logger.info("Digital Twin Workflow initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize Digital Twin Workflow: {str(e)}")
@@ -365,13 +378,8 @@ async def generate_text(
 async def generate_text_background(job_id: str, input_data: GenerateTextInput):
     """Background task for text generation."""
     try:
-        # Run the synchronous workflow in a thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        
-        # Generate hot take using GPT
-        hot_take_result = await loop.run_in_executor(
-            None,
-            workflow.hot_take_generator.generate_hot_take,
+        # Generate hot take using GPT (async client, so the event loop isn't blocked)
+        hot_take_result = await workflow.hot_take_generator.agenerate_hot_take(
             input_data.text, 
             input_data.context, 
             input_data.persona_id
@@ -535,15 +543,14 @@ async def generate_video_background(job_id: str, input_data: GenerateVideoInput)
         # Get persona's avatar ID
         persona = persona_manager.get_persona(input_data.persona_id)
         
-        # Debug: Print persona details
-        print(f"🔍 DEBUG - generate_video_background:")
-        print(f"   requested persona_id: {input_data.persona_id}")
-        print(f"   persona name: {persona.name if persona else 'None'}")
-        print(f"   persona heygen_avatar_id: {persona.heygen_avatar_id if persona else 'None'}")
-        print(f"   input_data.avatar_id: {input_data.avatar_id}")
-        
         avatar_id = input_data.avatar_id or persona.heygen_avatar_id if persona else None
-        print(f"   final avatar_id: {avatar_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"generate_video_background: persona_id={input_data.persona_id} "
+                f"(name {persona.name if persona else None}, "
+                f"heygen_avatar_id {persona.heygen_avatar_id if persona else None}), "
+                f"requested avatar_id={input_data.avatar_id}, final avatar_id={avatar_id}"
+            )
         
         # Generate video filename
         output_filename = input_data.output_filename or f"video_job_{job_id}"
@@ -1009,12 +1016,12 @@ async def generate_pitch(input_data: GeneratePitchInput):
         start_time = time.time()
         
         # Use job_id internally for file naming
-        job_id = str(uuid.uuid4())
+        job_id = new_job_id()
         
         logger.info(f"Starting pitch generation for idea: {input_data.idea[:50]}... with persona: {persona_id}")
         
         # Step 1: Generate text (hot take) using the idea as context
-        hot_take_result = workflow.hot_take_generator.generate_hot_take(
+        hot_take_result = await workflow.hot_take_generator.agenerate_hot_take(
             input_data.idea,  # The pitch idea to respond to
             context=None,
             persona_id=persona_id
@@ -1201,7 +1208,7 @@ async def get_service_info():
                 
                 # Get job count using the list_jobs method
                 try:
-                    all_jobs = job_storage.list_jobs(limit=1000)
+                    all_jobs = job_storage.list_jobs(limit=1000, fields=["id"])
                     info["job_storage"]["active_jobs_count"] = len(all_jobs)
                 except Exception as e:
                     info["job_storage"]["active_jobs_count"] = 0